@@ -1,13 +1,46 @@
-"""Core business logic package."""
+"""Core business logic package.
 
-from .audio_generator import AudioGenerationError, AudioGenerator
-from .project_manager import ProjectManager, ProjectNotFoundError
-from .prompt_optimizer import PromptOptimizer
-from .providers import ProviderConfigError, SceneParsingProvider, get_scene_provider
-from .resolve_exporter import ResolveExporter, ResolveExportError
-from .scene_parser import SceneParser, SceneParsingError
-from .script_generator import ScriptGenerator, TemplateNotFoundError
-from .video_generator import VideoGenerationError, VideoGenerator
+Names are resolved lazily (PEP 562), so importing ``ProjectManager`` does
+not load the Anthropic, OpenAI or Google GenAI SDKs behind the generators.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .audio_generator import AudioGenerationError, AudioGenerator
+    from .project_manager import ProjectManager, ProjectNotFoundError
+    from .prompt_optimizer import PromptOptimizer
+    from .providers import (
+        ProviderConfigError,
+        SceneParsingProvider,
+        get_scene_provider,
+    )
+    from .resolve_exporter import ResolveExporter, ResolveExportError
+    from .scene_parser import SceneParser, SceneParsingError
+    from .script_generator import ScriptGenerator, TemplateNotFoundError
+    from .video_generator import PromptBuilder, VideoGenerationError, VideoGenerator
+
+# Public name -> submodule that defines it
+_LAZY = {
+    "AudioGenerator": "audio_generator",
+    "AudioGenerationError": "audio_generator",
+    "ProjectManager": "project_manager",
+    "ProjectNotFoundError": "project_manager",
+    "ResolveExporter": "resolve_exporter",
+    "ResolveExportError": "resolve_exporter",
+    "VideoGenerator": "video_generator",
+    "VideoGenerationError": "video_generator",
+    "PromptBuilder": "video_generator",
+    "ScriptGenerator": "script_generator",
+    "TemplateNotFoundError": "script_generator",
+    "PromptOptimizer": "prompt_optimizer",
+    "ProviderConfigError": "providers",
+    "SceneParsingProvider": "providers",
+    "get_scene_provider": "providers",
+    "SceneParser": "scene_parser",
+    "SceneParsingError": "scene_parser",
+}
 
 __all__ = [
     "AudioGenerator",
@@ -18,6 +51,7 @@ __all__ = [
     "ResolveExportError",
     "VideoGenerator",
     "VideoGenerationError",
+    "PromptBuilder",
     "ScriptGenerator",
     "TemplateNotFoundError",
     "PromptOptimizer",
@@ -27,3 +61,20 @@ __all__ = [
     "SceneParser",
     "SceneParsingError",
 ]
+# Keep the literal list (read by linters) in step with the lazy table
+assert set(__all__) == set(_LAZY)
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
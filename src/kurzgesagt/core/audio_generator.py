@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import hashlib
+import os
+import uuid
 from pathlib import Path
 from typing import Optional, Tuple
 
@@ -18,6 +21,9 @@ from ..utils import ensure_directory, get_logger
 
 logger = get_logger("audio_generator")
 
+TTS_CACHE_DIR = ".tts_cache"  # Store of synthesized clips by input hash
+TTS_CACHE_MAX_BYTES = 200 * 1024 * 1024  # Least recently used clips go first
+
 
 class AudioGenerationError(RuntimeError):
     """Raised when audio generation fails."""
@@ -31,6 +37,7 @@ class AudioGenerator:
         api_key: Optional[str] = None,
         model: str = "tts-1",
         voice: str = "alloy",
+        cache_dir: Optional[Path] = None,
     ) -> None:
         """Initialize audio generator.
 
@@ -38,6 +45,7 @@ class AudioGenerator:
             api_key: OpenAI API key (defaults to settings)
             model: TTS model to use ("tts-1" or "tts-1-hd")
             voice: Voice to use (alloy, echo, fable, onyx, nova, shimmer)
+            cache_dir: Directory for reusing synthesized clips (disabled if None)
         """
         resolved_key = api_key or settings.openai_api_key
         if not resolved_key or resolved_key == "your_api_key_here":
@@ -45,6 +53,7 @@ class AudioGenerator:
         self.client = OpenAI(api_key=resolved_key)
         self.model = model
         self.voice = voice
+        self.cache_dir = cache_dir
 
     def generate_audio_bytes(
         self,
@@ -55,6 +64,9 @@ class AudioGenerator:
     ) -> bytes:
         """Generate audio from text and return bytes.
 
+        With a ``cache_dir``, clips are stored by a hash of the text, model,
+        voice and speed, so unchanged narration is not synthesized again.
+
         Args:
             text: Text to convert to speech
             model: TTS model override
@@ -70,6 +82,11 @@ class AudioGenerator:
         model_name = model or self.model
         voice_name = voice or self.voice
 
+        cache_key = self._cache_key(text, model_name, voice_name, speed)
+        cached = self._load_cached(cache_key)
+        if cached is not None:
+            return cached
+
         logger.info(
             "Generating audio: model=%s voice=%s speed=%s text_length=%d",
             model_name,
@@ -89,12 +106,87 @@ class AudioGenerator:
             # Read the audio bytes from the streaming response
             audio_bytes = response.read()
             logger.info("Audio generated successfully: %d bytes", len(audio_bytes))
-            return audio_bytes
 
         except Exception as e:
             logger.error("Audio generation failed: %s", str(e))
             raise AudioGenerationError(f"Failed to generate audio: {str(e)}") from e
 
+        self._save_to_cache(cache_key, audio_bytes)
+        return audio_bytes
+
+    @staticmethod
+    def _cache_key(text: str, model: str, voice: str, speed: float) -> str:
+        """Hash every input that determines the synthesized clip."""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(text.strip().encode("utf-8"))
+        digest.update(f"\0{model}\0{voice}\0{speed:.3f}".encode("utf-8"))
+        return digest.hexdigest()
+
+    def _load_cached(self, cache_key: str) -> Optional[bytes]:
+        """Return a previously synthesized clip for these inputs, if any."""
+        if self.cache_dir is None:
+            return None
+
+        cache_path = self.cache_dir / f"{cache_key}.mp3"
+        try:
+            audio_bytes = cache_path.read_bytes()
+            # Mark as recently used; atime is often not updated on read
+            os.utime(cache_path)
+        except OSError:
+            return None
+
+        logger.info("Reusing cached audio %s", cache_path.name)
+        return audio_bytes
+
+    def _save_to_cache(self, cache_key: str, audio_bytes: bytes) -> None:
+        """Store a synthesized clip atomically; cache failures are not fatal."""
+        if self.cache_dir is None:
+            return
+
+        cache_path = self.cache_dir / f"{cache_key}.mp3"
+        tmp_path = self.cache_dir / f"{cache_key}.{uuid.uuid4().hex}.tmp"
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(audio_bytes)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning("Could not cache audio %s: %s", cache_key, str(e))
+            tmp_path.unlink(missing_ok=True)
+            return
+
+        self._evict_cache()
+
+    def _evict_cache(self) -> None:
+        """Delete least recently used clips while the cache is over its limit."""
+        entries = []
+        total = 0
+        try:
+            with os.scandir(self.cache_dir) as it:
+                for entry in it:
+                    if not entry.name.endswith(".mp3"):
+                        continue
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+                    total += stat.st_size
+        except OSError:
+            return
+
+        if total <= TTS_CACHE_MAX_BYTES:
+            return
+
+        entries.sort()
+        for _, size, path in entries:
+            if total <= TTS_CACHE_MAX_BYTES:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+
     def save_audio(
         self,
         text: str,
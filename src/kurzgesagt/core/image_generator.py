@@ -12,7 +12,7 @@ from google.genai import types
 from PIL import Image
 
 from ..config import settings
-from ..utils import ensure_directory, get_logger
+from ..utils import ensure_directory, get_logger, write_bytes_unbuffered
 
 logger = get_logger("image_generator")
 
@@ -145,5 +145,5 @@ class ImageGenerator:
         scene_dir = project_dir / "images" / f"scene_{scene_number:02d}"
         ensure_directory(scene_dir)
         image_path = scene_dir / f"shot_{shot_number:02d}.png"
-        image_path.write_bytes(image_bytes)
+        write_bytes_unbuffered(image_path, image_bytes)
         return image_path
@@ -2,7 +2,7 @@
 
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterable, List, Optional, Tuple
 
 from ..config import settings
 from ..models import ProjectConfig
@@ -86,7 +86,7 @@ class ProjectManager:
         if not config_file.exists():
             raise ProjectNotFoundError(f"Project '{project_name}' not found")
 
-        return ProjectConfig.from_yaml(config_file)
+        return ProjectConfig.from_yaml_trusted(config_file)
 
     def save(self, config: ProjectConfig, project_name: Optional[str] = None) -> Path:
         """
@@ -225,6 +225,7 @@ class ProjectManager:
         shot.duration = actual_duration
 
         # Recalculate scene duration
+        scene.reset_timing()
         scene.duration = scene.calculate_duration()
 
         # Save updated config
@@ -258,6 +259,86 @@ class ProjectManager:
         # Save updated config
         self.save(config, project_name)
 
+    def update_shot_durations(
+        self,
+        project_name: str,
+        durations: Iterable[Tuple[int, int, float]],
+    ) -> None:
+        """
+        Update several shots' durations and save the project once.
+
+        Shots that exist are updated (and their scenes recalculated) even if
+        others are missing; the missing ones are reported afterwards.
+
+        Args:
+            project_name: Project name
+            durations: ``(scene_number, shot_number, actual_duration)`` triples
+
+        Raises:
+            ProjectNotFoundError: If project doesn't exist
+            ValueError: If any scene or shot was not found
+        """
+        config = self.load(project_name)
+        touched = {}
+        missing = []
+
+        for scene_number, shot_number, actual_duration in durations:
+            scene = config.get_scene(scene_number)
+            shot = scene.get_shot(shot_number) if scene else None
+            if not shot:
+                missing.append(f"Scene {scene_number}, Shot {shot_number}")
+                continue
+            shot.duration = actual_duration
+            touched[scene_number] = scene
+
+        # Recalculate each affected scene once
+        for scene in touched.values():
+            scene.reset_timing()
+            scene.duration = scene.calculate_duration()
+
+        if touched:
+            self.save(config, project_name)
+
+        if missing:
+            raise ValueError(f"Shots not found in project: {'; '.join(missing)}")
+
+    def update_scene_durations(
+        self,
+        project_name: str,
+        durations: Iterable[Tuple[int, float]],
+    ) -> None:
+        """
+        Update several scenes' durations and save the project once.
+
+        Scenes that exist are updated even if others are missing; the
+        missing ones are reported afterwards.
+
+        Args:
+            project_name: Project name
+            durations: ``(scene_number, actual_duration)`` pairs
+
+        Raises:
+            ProjectNotFoundError: If project doesn't exist
+            ValueError: If any scene was not found
+        """
+        config = self.load(project_name)
+        updated = False
+        missing = []
+
+        for scene_number, actual_duration in durations:
+            scene = config.get_scene(scene_number)
+            if not scene:
+                missing.append(f"Scene {scene_number}")
+                continue
+            scene.duration = actual_duration
+            updated = True
+
+        if updated:
+            self.save(config, project_name)
+
+        if missing:
+            raise ValueError(f"Scenes not found in project: {'; '.join(missing)}")
+
     def update_transition_durations(
         self,
         project_name: str,
@@ -284,6 +365,7 @@ class ProjectManager:
             # Update shot transitions
             for shot in scene.shots:
                 shot.transition_duration = shot_transition
+            scene.reset_timing()
 
         # Save updated config
         self.save(config, project_name)
@@ -6,7 +6,8 @@ from typing import Any, Dict, List, Optional, cast
 
 from pydantic import ValidationError as PydanticValidationError
 
-from ..models import Scene, Shot, StyleGuide
+from ..models import Scene, StyleGuide
+from ..models.scene import SHOT_LIST_ADAPTER
 from ..utils import get_logger
 from .providers import ProviderConfigError, SceneParsingProvider, get_scene_provider
 
@@ -375,10 +376,7 @@ class SceneParser:
 
         for scene_data in data.get("scenes", []):
             # Parse shots
-            shots = []
-            for shot_data in scene_data.get("shots", []):
-                shot = Shot(**shot_data)
-                shots.append(shot)
+            shots = SHOT_LIST_ADAPTER.validate_python(scene_data.get("shots", []))
 
             # Create scene
             scene = Scene(
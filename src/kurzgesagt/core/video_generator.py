@@ -2,24 +2,128 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import os
+import random
 import time
+import uuid
+from contextlib import nullcontext
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
 
+import httpx
 import requests
 from google import genai
 from google.genai import types
 
-from ..utils import get_logger
+from ..utils import get_logger, write_bytes_unbuffered
 
 logger = get_logger("video_generator")
 
+VIDEO_MODEL = "veo-3.1-generate-preview"
+POLL_INTERVAL_SECONDS = 10  # Base delay, restored whenever the job reports progress
+POLL_MAX_INTERVAL_SECONDS = 30
+POLL_BACKOFF_FACTOR = 1.5
+POLL_JITTER_RATIO = 0.2  # Spread concurrent polls so they don't fire in lockstep
+POLL_TIMEOUT_SECONDS = 600  # 10 minutes max
+VIDEO_CACHE_DIR = ".veo_cache"  # Per-project store of generated clips by input hash
+
+# Default per-stage limits for batch generation:
+#   submit - concurrent generate_videos calls (API quota bound); nested
+#            inside the poll slot, so it only binds when below "poll"
+#   poll   - Veo jobs in flight, from submission until done
+#   save   - concurrent downloads and disk writes
+CONCURRENCY: Dict[str, int] = {"submit": 4, "poll": 4, "save": 8}
+
+# Connection pool for the Gemini client, sized well above the submit + poll
+# stage limits so concurrent status checks never queue for a connection
+HTTP_POOL_SIZE = 64
+HTTP_TIMEOUT_MS = 60_000  # Per request; polls are short, submissions carry the image
+
+
+def stage_limits(overrides: Optional[Dict[str, int]] = None) -> Dict[str, int]:
+    """Merge per-stage overrides (e.g. from ``TechnicalSpecs``) over the defaults.
+
+    Raises:
+        ValueError: If a stage is unknown or a limit is below 1
+    """
+    limits = {**CONCURRENCY, **(overrides or {})}
+    unknown = limits.keys() - CONCURRENCY.keys()
+    if unknown:
+        raise ValueError(f"Unknown concurrency stages: {sorted(unknown)}")
+    for stage, limit in limits.items():
+        if limit < 1:
+            raise ValueError(f"{stage} concurrency must be at least 1")
+    return limits
+
 
 class VideoGenerationError(RuntimeError):
     """Raised when video generation fails."""
 
 
+class _PollBackoff:
+    """Delay schedule for polling one long-running operation.
+
+    Delays grow by ``POLL_BACKOFF_FACTOR`` up to ``POLL_MAX_INTERVAL_SECONDS``
+    while the operation looks idle, and drop back to the base interval
+    whenever its reported progress moves forward.
+    """
+
+    def __init__(self) -> None:
+        self.elapsed = 0.0
+        self._delay = float(POLL_INTERVAL_SECONDS)
+        self._progress: Optional[float] = None
+        self._next_heartbeat = 60.0
+
+    def next_delay(self) -> float:
+        """Return the wait before the next poll, with jitter.
+
+        Raises:
+            VideoGenerationError: If the polling time budget is exhausted
+        """
+        if self.elapsed >= POLL_TIMEOUT_SECONDS:
+            raise VideoGenerationError(
+                "Video generation timed out after "
+                f"{POLL_TIMEOUT_SECONDS / 60:g} minutes"
+            )
+        return self._delay + random.uniform(0, self._delay * POLL_JITTER_RATIO)
+
+    def record(self, operation: Any, slept: float) -> None:
+        """Update the schedule after a poll and log a heartbeat each minute."""
+        self.elapsed += slept
+
+        progress = _operation_progress(operation)
+        if progress is not None and (
+            self._progress is None or progress > self._progress
+        ):
+            self._progress = progress
+            self._delay = float(POLL_INTERVAL_SECONDS)
+        else:
+            self._delay = min(
+                self._delay * POLL_BACKOFF_FACTOR, POLL_MAX_INTERVAL_SECONDS
+            )
+
+        if self.elapsed >= self._next_heartbeat:
+            self._next_heartbeat += 60.0
+            suffix = f", {self._progress:g}% done" if self._progress is not None else ""
+            logger.info(f"Still generating... ({self.elapsed:.0f}s elapsed{suffix})")
+
+
+def _operation_progress(operation: Any) -> Optional[float]:
+    """Read a progress percentage from operation metadata, if the service sends one."""
+    metadata = getattr(operation, "metadata", None)
+    if not isinstance(metadata, dict):
+        return None
+    for key in ("progressPercent", "progress_percent", "progress"):
+        value = metadata.get(key)
+        if isinstance(value, (int, float)):
+            return float(value)
+    return None
+
+
 @dataclass
 class VideoResult:
     """Result of video generation with optional manual download URI."""
@@ -38,6 +142,54 @@ class VideoResult:
         return self.uri is not None and self.requires_manual_download
 
 
+class PromptBuilder:
+    """Build Veo prompts for shots that share one style context.
+
+    The style context is truncated once, so a project's shots can reuse a
+    single builder instead of re-slicing the aesthetic for every shot.
+    """
+
+    # Constant camera/consistency guidance appended to every video prompt
+    _PROMPT_SUFFIX = (
+        "\n\nCamera movement: Smooth cinematic motion with subtle zoom and "
+        "parallax effects.\n"
+        "Maintain visual consistency with the starting image while adding "
+        "dynamic movement.\n"
+    )
+
+    def __init__(self, style_context: str) -> None:
+        self.style_context = style_context
+        # Everything after the key elements is fixed per style; build it once.
+        # Limit style context to 500 chars
+        self._style_block = (
+            f"\nStyle and animation details:\n"
+            f"{style_context[:500]}"
+            f"{self._PROMPT_SUFFIX}"
+        )
+
+    def build(
+        self, base_prompt: str, key_elements: Sequence[str], duration: int
+    ) -> str:
+        """Build the prompt for one shot from its list of key elements."""
+        elements_str = ", ".join(key_elements) if key_elements else "all elements"
+        return self.render(base_prompt, elements_str, duration)
+
+    def render(self, base_prompt: str, key_elements: str, duration: int) -> str:
+        """Build the prompt for one shot from pre-joined key elements."""
+        return (
+            f"{base_prompt}\n"
+            f"\nAnimate these key elements: {key_elements}\n"
+            f"{self._style_block}"
+            f"Duration: {duration} seconds with consistent pacing throughout."
+        )
+
+
+@lru_cache(maxsize=32)
+def _prompt_builder_for(style_context: str) -> PromptBuilder:
+    """Share one builder per style across calls that don't pass their own."""
+    return PromptBuilder(style_context)
+
+
 class VideoGenerator:
     """Generate animated videos from images using Google Veo 3.1.
 
@@ -57,17 +209,30 @@ class VideoGenerator:
             raise VideoGenerationError("Gemini API key is required")
 
         self.api_key = api_key
-        self.client = genai.Client(api_key=api_key)
+
+        pool_limits = httpx.Limits(
+            max_connections=HTTP_POOL_SIZE,
+            max_keepalive_connections=HTTP_POOL_SIZE // 2
+        )
+        self.client = genai.Client(
+            api_key=api_key,
+            http_options=types.HttpOptions(
+                timeout=HTTP_TIMEOUT_MS,
+                client_args={"limits": pool_limits},
+                async_client_args={"limits": pool_limits}
+            )
+        )
         logger.info("VideoGenerator initialized with Gemini API")
 
     def generate_video_from_image(
         self,
         image_path: Path,
         video_prompt: str,
-        key_elements: List[str],
+        key_elements: Sequence[str],
         style_context: str,
         duration: int = 8,
-        aspect_ratio: str = "9:16"
+        aspect_ratio: str = "9:16",
+        prompt_builder: Optional[PromptBuilder] = None
     ) -> VideoResult:
         """Generate video from image using Veo 3.1.
 
@@ -78,6 +243,48 @@ class VideoGenerator:
             style_context: Aesthetic description from config.style
             duration: Video duration in seconds (default: 8, Veo 3.1 limit)
             aspect_ratio: Output aspect ratio (default: 9:16)
+            prompt_builder: Shared builder for ``style_context`` (optional)
+
+        Returns:
+            VideoResult: Contains video bytes or URI for manual download
+
+        Raises:
+            VideoGenerationError: If generation fails (not download)
+        """
+        logger.info(f"Generating video from {image_path}")
+
+        enhanced_prompt = self._prepare_prompt(
+            video_prompt, key_elements, style_context, duration, prompt_builder
+        )
+        operation = self._submit(image_path, enhanced_prompt, duration)
+
+        operation = self._poll(operation)
+        return self._extract_result(operation)
+
+    async def generate_video_from_image_async(
+        self,
+        image_path: Path,
+        video_prompt: str,
+        key_elements: Sequence[str],
+        style_context: str,
+        duration: int = 8,
+        aspect_ratio: str = "9:16",
+        prompt_builder: Optional[PromptBuilder] = None
+    ) -> VideoResult:
+        """Async variant of :meth:`generate_video_from_image`.
+
+        Submission and download run in worker threads; polling uses the
+        SDK's async client and ``asyncio.sleep``, so waiting shots hold no
+        thread and many can be in flight at once.
+
+        Args:
+            image_path: Path to PNG image (first frame)
+            video_prompt: Base prompt for video animation
+            key_elements: List of elements to animate
+            style_context: Aesthetic description from config.style
+            duration: Video duration in seconds (default: 8, Veo 3.1 limit)
+            aspect_ratio: Output aspect ratio (default: 9:16)
+            prompt_builder: Shared builder for ``style_context`` (optional)
 
         Returns:
             VideoResult: Contains video bytes or URI for manual download
@@ -87,59 +294,160 @@ class VideoGenerator:
         """
         logger.info(f"Generating video from {image_path}")
 
-        # Read image as bytes
+        enhanced_prompt = self._prepare_prompt(
+            video_prompt, key_elements, style_context, duration, prompt_builder
+        )
+        operation = await asyncio.to_thread(
+            self._submit, image_path, enhanced_prompt, duration
+        )
+        operation = await self._poll_async(operation)
+        return await asyncio.to_thread(self._extract_result, operation)
+
+    def _poll(self, operation: Any) -> Any:
+        """Poll a long-running operation until it completes.
+
+        Args:
+            operation: Operation returned by ``generate_videos``
+
+        Returns:
+            The completed operation
+
+        Raises:
+            VideoGenerationError: If polling fails or times out
+        """
+        logger.info("Polling for video generation completion...")
+        backoff = _PollBackoff()
+
+        while not operation.done:
+            delay = backoff.next_delay()
+            time.sleep(delay)
+
+            operation = self._refresh_operation(operation)
+            backoff.record(operation, delay)
+
+        return operation
+
+    async def _poll_async(self, operation: Any) -> Any:
+        """Poll a long-running operation without blocking the event loop.
+
+        Args:
+            operation: Operation returned by ``generate_videos``
+
+        Returns:
+            The completed operation
+
+        Raises:
+            VideoGenerationError: If polling fails or times out
+        """
+        logger.info("Polling for video generation completion...")
+        backoff = _PollBackoff()
+
+        while not operation.done:
+            delay = backoff.next_delay()
+            await asyncio.sleep(delay)
+
+            operation = await self._refresh_operation_async(operation)
+            backoff.record(operation, delay)
+
+        return operation
+
+    def _read_image(self, image_path: Path) -> bytes:
+        """Read the first-frame image for submission.
+
+        Raises:
+            VideoGenerationError: If the image cannot be read
+        """
         try:
-            with open(image_path, 'rb') as f:
-                image_bytes = f.read()
+            return image_path.read_bytes()
         except Exception as e:
             raise VideoGenerationError(f"Failed to read image: {e}") from e
 
-        # Construct enhanced prompt
-        elements_str = ", ".join(key_elements) if key_elements else "all elements"
-        enhanced_prompt = self._build_video_prompt(
-            video_prompt, elements_str, style_context, duration
-        )
+    def _submit(
+        self,
+        image_path: Path,
+        enhanced_prompt: str,
+        duration: int,
+        webhook: Optional[types.WebhookConfig] = None
+    ) -> Any:
+        """Read the first frame and submit the generation job."""
+        image_bytes = self._read_image(image_path)
+        return self._start_generation(image_bytes, enhanced_prompt, duration, webhook)
+
+    def _prepare_prompt(
+        self,
+        video_prompt: str,
+        key_elements: Sequence[str],
+        style_context: str,
+        duration: int,
+        prompt_builder: Optional[PromptBuilder] = None
+    ) -> str:
+        """Build the enhanced prompt for a shot, reusing ``prompt_builder`` if given."""
+        if prompt_builder is None:
+            prompt_builder = _prompt_builder_for(style_context)
+        enhanced_prompt = prompt_builder.build(video_prompt, key_elements, duration)
 
         logger.debug(f"Video prompt: {enhanced_prompt[:200]}...")
+        return enhanced_prompt
+
+    def _start_generation(
+        self,
+        image_bytes: bytes,
+        enhanced_prompt: str,
+        duration: int,
+        webhook: Optional[types.WebhookConfig] = None
+    ) -> Any:
+        """Submit the image-to-video job and return the pending operation.
+
+        Raises:
+            VideoGenerationError: If the request is rejected
+        """
+        config: Dict[str, Any] = {"aspect_ratio": "9:16", "duration_seconds": duration}
+        # Only the webhook path sets this; polling requests stay plain
+        if webhook is not None:
+            config["webhook_config"] = webhook
 
-        # Start video generation operation
         try:
-            operation = self.client.models.generate_videos(
-                model="veo-3.1-generate-preview",
+            return self.client.models.generate_videos(
+                model=VIDEO_MODEL,
                 prompt=enhanced_prompt,
                 image=types.Image(
                     image_bytes=image_bytes,
                     mime_type="image/png"
                 ),
-                config=types.GenerateVideosConfig(
-                    aspect_ratio="9:16",
-                    duration_seconds=duration
-                )
+                config=types.GenerateVideosConfig(**config)
             )
         except Exception as e:
             raise VideoGenerationError(f"Failed to start video generation: {e}") from e
 
-        # Poll for completion
-        logger.info("Polling for video generation completion...")
-        poll_count = 0
-        max_polls = 60  # 10 minutes max (10s intervals)
+    def _refresh_operation(self, operation: Any) -> Any:
+        """Fetch the latest status of a pending operation.
 
-        while not operation.done:
-            if poll_count >= max_polls:
-                raise VideoGenerationError("Video generation timed out after 10 minutes")
+        Raises:
+            VideoGenerationError: If the status request fails
+        """
+        try:
+            # Pass the operation object itself, not operation.name
+            return self.client.operations.get(operation)
+        except Exception as e:
+            raise VideoGenerationError(f"Failed to poll operation status: {e}") from e
 
-            time.sleep(10)  # Wait 10 seconds between polls
+    async def _refresh_operation_async(self, operation: Any) -> Any:
+        """Fetch operation status with the SDK's native async client.
 
-            try:
-                # Pass the operation object itself, not operation.name
-                operation = self.client.operations.get(operation)
-            except Exception as e:
-                raise VideoGenerationError(f"Failed to poll operation status: {e}") from e
+        Raises:
+            VideoGenerationError: If the status request fails
+        """
+        try:
+            return await self.client.aio.operations.get(operation)
+        except Exception as e:
+            raise VideoGenerationError(f"Failed to poll operation status: {e}") from e
 
-            poll_count += 1
-            if poll_count % 6 == 0:  # Log every minute
-                logger.info(f"Still generating... ({poll_count * 10}s elapsed)")
+    def _extract_result(self, operation: Any) -> VideoResult:
+        """Extract video bytes (or a fallback URI) from a completed operation.
 
+        Raises:
+            VideoGenerationError: If the operation carries no usable video
+        """
         # Extract video bytes from result
         if not operation.response:
             raise VideoGenerationError("Operation completed but no video data returned")
@@ -235,17 +543,9 @@ class VideoGenerator:
         Returns:
             Enhanced prompt string
         """
-        prompt_parts = [
-            base_prompt,
-            f"\nAnimate these key elements: {key_elements}",
-            "\nStyle and animation details:",
-            style_context[:500],  # Limit style context to 500 chars
-            "\nCamera movement: Smooth cinematic motion with subtle zoom and parallax effects.",
-            "Maintain visual consistency with the starting image while adding dynamic movement.",
-            f"Duration: {duration} seconds with consistent pacing throughout."
-        ]
-
-        return "\n".join(prompt_parts)
+        return _prompt_builder_for(style_context).render(
+            base_prompt, key_elements, duration
+        )
 
     def save_shot_video(
         self,
@@ -254,12 +554,18 @@ class VideoGenerator:
         shot_number: int,
         image_path: Path,
         video_prompt: str,
-        key_elements: List[str],
+        key_elements: Sequence[str],
         style_context: str,
-        duration: int = 8
-    ) -> Union[Path, str, dict]:
+        duration: int = 8,
+        prompt_builder: Optional[PromptBuilder] = None,
+        force_refresh: bool = False
+    ) -> Union[Path, str]:
         """Generate and save video for a specific shot.
 
+        Clips are cached under ``project_dir/.veo_cache`` by a hash of the
+        first frame, the final prompt, the model and the duration, so
+        re-running unchanged shots reuses the earlier result.
+
         Args:
             project_dir: Project root directory
             scene_number: Scene number (1-indexed)
@@ -269,6 +575,8 @@ class VideoGenerator:
             key_elements: Elements to animate
             style_context: Style description
             duration: Video duration in seconds (default: 8, max: 8)
+            prompt_builder: Shared builder for ``style_context`` (optional)
+            force_refresh: Regenerate even if an identical clip is cached
 
         Returns:
             Path: Saved video file path if successful
@@ -280,16 +588,351 @@ class VideoGenerator:
         # Ensure duration doesn't exceed API limit
         duration = min(duration, 8)
 
-        # Generate video
-        result = self.generate_video_from_image(
+        logger.info(f"Generating video from {image_path}")
+        enhanced_prompt = self._prepare_prompt(
+            video_prompt, key_elements, style_context, duration, prompt_builder
+        )
+
+        image_bytes = self._read_image(image_path)
+        cache_key = self._cache_key(image_bytes, enhanced_prompt, duration)
+        result = None if force_refresh else self._load_cached(project_dir, cache_key)
+
+        if result is None:
+            operation = self._start_generation(image_bytes, enhanced_prompt, duration)
+            operation = self._poll(operation)
+            result = self._extract_result(operation)
+            self._save_to_cache(project_dir, cache_key, result)
+
+        return self._store_result(result, project_dir, scene_number, shot_number)
+
+    async def save_shot_video_async(
+        self,
+        project_dir: Path,
+        scene_number: int,
+        shot_number: int,
+        image_path: Path,
+        video_prompt: str,
+        key_elements: Sequence[str],
+        style_context: str,
+        duration: int = 8,
+        prompt_builder: Optional[PromptBuilder] = None,
+        force_refresh: bool = False
+    ) -> Union[Path, str]:
+        """Async variant of :meth:`save_shot_video`.
+
+        Args:
+            project_dir: Project root directory
+            scene_number: Scene number (1-indexed)
+            shot_number: Shot number (1-indexed)
+            image_path: Path to source image
+            video_prompt: Video animation prompt
+            key_elements: Elements to animate
+            style_context: Style description
+            duration: Video duration in seconds (default: 8, max: 8)
+            prompt_builder: Shared builder for ``style_context`` (optional)
+            force_refresh: Regenerate even if an identical clip is cached
+
+        Returns:
+            Path: Saved video file path if successful
+            str: Download URI if automatic download failed
+
+        Raises:
+            VideoGenerationError: If generation fails
+        """
+        return await self._save_shot_staged(
+            None,
+            project_dir=project_dir,
+            scene_number=scene_number,
+            shot_number=shot_number,
             image_path=image_path,
             video_prompt=video_prompt,
             key_elements=key_elements,
             style_context=style_context,
             duration=duration,
-            aspect_ratio="9:16"
+            prompt_builder=prompt_builder,
+            force_refresh=force_refresh
         )
 
+    async def _save_shot_staged(
+        self,
+        slots: Optional[Dict[str, asyncio.Semaphore]],
+        project_dir: Path,
+        scene_number: int,
+        shot_number: int,
+        image_path: Path,
+        video_prompt: str,
+        key_elements: Sequence[str],
+        style_context: str,
+        duration: int = 8,
+        prompt_builder: Optional[PromptBuilder] = None,
+        force_refresh: bool = False
+    ) -> Union[Path, str]:
+        """Run one shot through the submit, poll and save stages.
+
+        ``slots`` maps each stage in :data:`CONCURRENCY` to its semaphore.
+        The poll slot is taken before the image is read and held until the
+        job is done, so it bounds both Veo jobs in flight and the images held
+        in memory; the bytes are dropped once submitted. The submit slot
+        nests inside it and is released once Veo accepts the job; it only
+        binds when set below the poll limit. Downloading and writing only
+        hold a save slot, letting the next submission start meanwhile.
+        """
+        def stage(name: str) -> Any:
+            return slots[name] if slots is not None else nullcontext()
+
+        # Ensure duration doesn't exceed API limit
+        duration = min(duration, 8)
+
+        logger.info(f"Generating video from {image_path}")
+        enhanced_prompt = self._prepare_prompt(
+            video_prompt, key_elements, style_context, duration, prompt_builder
+        )
+
+        # Read the image inside the slot so a batch only holds as many images
+        # in memory as it has jobs in flight
+        async with stage("poll"):
+            image_bytes = await asyncio.to_thread(self._read_image, image_path)
+            cache_key = await asyncio.to_thread(
+                self._cache_key, image_bytes, enhanced_prompt, duration
+            )
+            result = None
+            if not force_refresh:
+                result = await asyncio.to_thread(
+                    self._load_cached, project_dir, cache_key
+                )
+
+            # Cache hits skip submission and polling entirely
+            if result is None:
+                async with stage("submit"):
+                    operation = await asyncio.to_thread(
+                        self._start_generation, image_bytes, enhanced_prompt, duration
+                    )
+            del image_bytes
+
+            if result is None:
+                operation = await self._poll_async(operation)
+
+        async with stage("save"):
+            if result is None:
+                result = await asyncio.to_thread(self._extract_result, operation)
+                await asyncio.to_thread(
+                    self._save_to_cache, project_dir, cache_key, result
+                )
+
+            return await asyncio.to_thread(
+                self._store_result, result, project_dir, scene_number, shot_number
+            )
+
+    def save_shot_video_webhook(
+        self,
+        scene_number: int,
+        shot_number: int,
+        image_path: Path,
+        video_prompt: str,
+        key_elements: Sequence[str],
+        style_context: str,
+        callback_url: str,
+        duration: int = 8
+    ) -> str:
+        """Submit a shot for generation and return without polling.
+
+        The Gemini API POSTs to ``callback_url`` when the job finishes. The
+        event carries ``scene_number`` and ``shot_number`` as user metadata,
+        so the handler can save the result with
+        :meth:`save_pending_shot_video`::
+
+            @app.post("/veo-callback")
+            def veo_callback(event: dict) -> None:
+                meta = event["userMetadata"]
+                generator.save_pending_shot_video(
+                    project_dir, meta["scene_number"], meta["shot_number"],
+                    event["name"]
+                )
+
+        Args:
+            scene_number: Scene number (1-indexed)
+            shot_number: Shot number within scene (1-indexed)
+            image_path: Path to source image
+            video_prompt: Video animation prompt
+            key_elements: Elements to animate
+            style_context: Style description
+            callback_url: Webhook URI notified on completion
+            duration: Video duration in seconds (default: 8, max: 8)
+
+        Returns:
+            Operation name to pass to :meth:`resolve_pending`
+
+        Raises:
+            VideoGenerationError: If the job cannot be submitted
+        """
+        duration = min(duration, 8)
+        enhanced_prompt = self._prepare_prompt(
+            video_prompt, key_elements, style_context, duration
+        )
+        webhook = types.WebhookConfig(
+            uris=[callback_url],
+            user_metadata={"scene_number": scene_number, "shot_number": shot_number}
+        )
+
+        operation = self._submit(image_path, enhanced_prompt, duration, webhook)
+        logger.info(
+            f"Submitted scene {scene_number}, shot {shot_number} as {operation.name}"
+        )
+        return operation.name
+
+    def resolve_pending(self, operation_name: str) -> VideoResult:
+        """Fetch a finished operation once, after its webhook has fired.
+
+        Args:
+            operation_name: Name returned by :meth:`save_shot_video_webhook`
+
+        Returns:
+            VideoResult: Contains video bytes or URI for manual download
+
+        Raises:
+            VideoGenerationError: If the operation is still running or failed
+        """
+        operation = self._refresh_operation(
+            types.GenerateVideosOperation(name=operation_name)
+        )
+        if not operation.done:
+            raise VideoGenerationError(f"Operation {operation_name} is still running")
+
+        return self._extract_result(operation)
+
+    def save_pending_shot_video(
+        self,
+        project_dir: Path,
+        scene_number: int,
+        shot_number: int,
+        operation_name: str
+    ) -> Union[Path, str]:
+        """Resolve a webhook-driven operation and save it like :meth:`save_shot_video`.
+
+        Returns:
+            Path: Saved video file path if successful
+            str: Download URI if automatic download failed
+
+        Raises:
+            VideoGenerationError: If the operation is unfinished or failed
+        """
+        result = self.resolve_pending(operation_name)
+        return self._store_result(result, project_dir, scene_number, shot_number)
+
+    async def save_shots_batch(
+        self,
+        shots: List[Dict[str, Any]],
+        max_concurrency: Optional[int] = None,
+        on_result: Optional[Callable[[int, Union[Path, str, Exception]], None]] = None,
+        concurrency: Optional[Dict[str, int]] = None
+    ) -> List[Union[Path, str, Exception]]:
+        """Generate and save videos for many shots concurrently.
+
+        Veo jobs spend minutes in server-side generation, so running several
+        at once cuts wall time roughly by the number of jobs in flight. Each
+        stage has its own limit (see :data:`CONCURRENCY`), so slow disk
+        writes never hold back submissions and vice versa.
+
+        Args:
+            shots: Keyword arguments for :meth:`save_shot_video_async`, one
+                dict per shot
+            max_concurrency: Maximum number of Veo jobs in flight at once;
+                shorthand for overriding the ``poll`` stage limit
+            on_result: Optional callback invoked as ``on_result(index, result)``
+                when each shot finishes, in completion order
+            concurrency: Per-stage limit overrides, e.g.
+                ``TechnicalSpecs.video_concurrency``
+
+        Returns:
+            One entry per shot, in input order: the saved Path, a manual
+            download URI, or the exception raised for that shot
+
+        Raises:
+            ValueError: If a stage limit is unknown or below 1
+        """
+        overrides = dict(concurrency or {})
+        if max_concurrency is not None:
+            overrides["poll"] = max_concurrency
+        limits = stage_limits(overrides)
+
+        # Semaphores bind to the running loop, so build them per batch
+        slots = {name: asyncio.Semaphore(limit) for name, limit in limits.items()}
+
+        async def run_shot(
+            index: int, kwargs: Dict[str, Any]
+        ) -> Union[Path, str, Exception]:
+            # Build the coroutine inside the task so a bad shot dict only
+            # fails that shot instead of aborting the whole batch
+            try:
+                result: Union[Path, str, Exception] = (
+                    await self._save_shot_staged(slots, **kwargs)
+                )
+            except Exception as e:
+                result = e
+            if on_result is not None:
+                on_result(index, result)
+            return result
+
+        return list(
+            await asyncio.gather(
+                *(run_shot(index, kwargs) for index, kwargs in enumerate(shots))
+            )
+        )
+
+    def _cache_key(
+        self, image_bytes: bytes, enhanced_prompt: str, duration: int
+    ) -> str:
+        """Hash every input that determines the generated clip.
+
+        Takes the image bytes already read for submission, so the file is
+        not read a second time.
+        """
+        digest = hashlib.blake2b(image_bytes, digest_size=16)
+        digest.update(b"\0" + enhanced_prompt.encode("utf-8"))
+        digest.update(f"\0{VIDEO_MODEL}\0{duration}".encode("utf-8"))
+        return digest.hexdigest()
+
+    def _load_cached(self, project_dir: Path, cache_key: str) -> Optional[VideoResult]:
+        """Return a previously generated clip for these inputs, if any."""
+        cache_path = project_dir / VIDEO_CACHE_DIR / f"{cache_key}.mp4"
+        try:
+            video_data = cache_path.read_bytes()
+        except OSError:
+            return None
+
+        logger.info(f"Reusing cached video {cache_path.name}")
+        return VideoResult(video_bytes=video_data)
+
+    def _save_to_cache(
+        self, project_dir: Path, cache_key: str, result: VideoResult
+    ) -> None:
+        """Store a downloaded clip atomically; cache failures are not fatal."""
+        if not result.success:
+            return
+
+        cache_dir = project_dir / VIDEO_CACHE_DIR
+        cache_path = cache_dir / f"{cache_key}.mp4"
+        tmp_path = cache_dir / f"{cache_key}.{uuid.uuid4().hex}.tmp"
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            write_bytes_unbuffered(tmp_path, result.video_bytes)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning(f"Could not cache video {cache_key}: {e}")
+            tmp_path.unlink(missing_ok=True)
+
+    def _store_result(
+        self,
+        result: VideoResult,
+        project_dir: Path,
+        scene_number: int,
+        shot_number: int
+    ) -> Union[Path, str]:
+        """Persist generated video bytes or fall back to the download URI.
+
+        Raises:
+            VideoGenerationError: If there is nothing to save or writing fails
+        """
         # Check if we got video bytes
         if result.success:
             # Save to project directory
@@ -299,7 +942,7 @@ class VideoGenerator:
             video_path = video_dir / f"shot_{shot_number:02d}.mp4"
 
             try:
-                video_path.write_bytes(result.video_bytes)
+                write_bytes_unbuffered(video_path, result.video_bytes)
                 logger.info(f"Saved video to {video_path}")
                 return video_path
 
@@ -1,25 +1,57 @@
-"""Data models package."""
-
-from .enums import (
-    Aesthetic,
-    AspectRatio,
-    ColorPalette,
-    ImageAspectRatio,
-    ImageResolution,
-    LineWork,
-    ModelType,
-    MotionPacing,
-    ShotComplexity,
-)
-from .project import (
-    CharacterConfig,
-    Environment,
-    ProjectConfig,
-    ProjectMetadata,
-    StyleGuide,
-    TechnicalSpecs,
-)
-from .scene import Scene, Shot
+"""Data models package.
+
+Names are resolved lazily (PEP 562), so importing only ``Shot`` does not
+build the project models or the ``Aesthetic`` presets.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .enums import (
+        Aesthetic,
+        AspectRatio,
+        ColorPalette,
+        ImageAspectRatio,
+        ImageResolution,
+        LineWork,
+        ModelType,
+        MotionPacing,
+        ShotComplexity,
+    )
+    from .project import (
+        CharacterConfig,
+        Environment,
+        ProjectConfig,
+        ProjectMetadata,
+        StyleGuide,
+        TechnicalSpecs,
+    )
+    from .scene import Scene, Shot
+
+# Public name -> submodule that defines it
+_LAZY = {
+    # Enums
+    "AspectRatio": "enums",
+    "ImageAspectRatio": "enums",
+    "ImageResolution": "enums",
+    "ModelType": "enums",
+    "ShotComplexity": "enums",
+    "ColorPalette": "enums",
+    "LineWork": "enums",
+    "MotionPacing": "enums",
+    "Aesthetic": "enums",
+    # Scene models
+    "Shot": "scene",
+    "Scene": "scene",
+    # Project models
+    "StyleGuide": "project",
+    "CharacterConfig": "project",
+    "Environment": "project",
+    "TechnicalSpecs": "project",
+    "ProjectMetadata": "project",
+    "ProjectConfig": "project",
+}
 
 __all__ = [
     # Enums
@@ -43,3 +75,20 @@ __all__ = [
     "ProjectMetadata",
     "ProjectConfig",
 ]
+# Keep the literal list (read by linters) in step with the lazy table
+assert set(__all__) == set(_LAZY)
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -2,6 +2,16 @@
 
 from enum import Enum
 
+_NO_TEXT_SUFFIX = " No text or lettering in the image."
+
+
+def _normalize_description(description: str) -> str:
+    """Trim a preset description and make sure it forbids rendered text."""
+    normalized = description.rstrip()
+    if "no text" not in normalized.lower():
+        normalized += _NO_TEXT_SUFFIX
+    return normalized
+
 
 class AspectRatio(str, Enum):
     """Supported video aspect ratios."""
@@ -297,10 +307,6 @@ class Aesthetic(Enum):
         "dependency chains clear for cascade animations"
     )
 
-
     def __init__(self, value: str, description: str) -> None:
         self._value_ = value
-        normalized = description.rstrip()
-        if "no text" not in normalized.lower():
-            normalized = f"{normalized} No text or lettering in the image."
-        self.description = normalized
+        self.description = _normalize_description(description)
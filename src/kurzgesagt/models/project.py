@@ -1,11 +1,25 @@
 """Project configuration data model."""
 
+import hashlib
+import json
 from datetime import datetime
+from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+)
 
 import yaml
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
 
 from .enums import (
     Aesthetic,
@@ -18,7 +32,82 @@ from .enums import (
     MotionPacing,
     ShotComplexity,
 )
-from .scene import Scene
+from .scene import NumberIndex, Scene, lookup_by_number
+
+# Prefer libyaml's C emitter/parser; fall back to pure Python without it
+try:
+    from yaml import CSafeDumper as _YamlDumper
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeDumper as _YamlDumper  # type: ignore[assignment]
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
+# Aesthetic keeps its tuple values in Enum's own lookup table, so map the
+# string ids explicitly
+_AESTHETIC_BY_VALUE: Dict[str, Aesthetic] = {item.value: item for item in Aesthetic}
+
+# Sidecar holding the schema tag and sha256 of the YAML last written by ``to_yaml``
+CHECKSUM_SUFFIX = ".sha256"
+
+# Bump when a validator changes how saved data is read; field and type
+# changes are picked up from the JSON schema (see ``_schema_tag``)
+SCHEMA_VERSION = 1
+
+_ModelT = TypeVar("_ModelT", bound=BaseModel)
+
+
+def _construct_value(annotation: Any, value: Any) -> Any:
+    """Rebuild a dumped value as ``annotation`` without running validators."""
+    if value is None:
+        return None
+
+    origin = get_origin(annotation)
+    if origin is Union:
+        # Only Optional[X] unions occur in these models
+        (inner,) = [arg for arg in get_args(annotation) if arg is not type(None)]
+        return _construct_value(inner, value)
+    if origin is list:
+        (item_type,) = get_args(annotation)
+        return [_construct_value(item_type, item) for item in value]
+    if origin is tuple:
+        return tuple(value)
+    if origin is not None:
+        return value  # Dict[str, int] and friends are stored as-is
+
+    if isinstance(annotation, type):
+        if issubclass(annotation, BaseModel):
+            return _construct_model(annotation, value)
+        if annotation is Aesthetic:
+            return _AESTHETIC_BY_VALUE[value]
+        if issubclass(annotation, Enum):
+            return annotation(value)
+        if annotation is datetime and isinstance(value, str):
+            return datetime.fromisoformat(value)
+    return value
+
+
+def _construct_model(model_cls: Type[_ModelT], data: Dict[str, Any]) -> _ModelT:
+    """Recursively ``model_construct`` a model from its JSON-mode dump."""
+    fields = model_cls.model_fields
+    unknown = data.keys() - fields.keys()
+    if unknown:
+        raise ValueError(
+            f"Unexpected fields for {model_cls.__name__}: {sorted(unknown)}"
+        )
+
+    values = {
+        name: _construct_value(fields[name].annotation, value)
+        for name, value in data.items()
+    }
+    return model_cls.model_construct(**values)
+
+
+@lru_cache(maxsize=None)
+def _schema_tag() -> str:
+    """Identify the model schema that checksummed files were validated under."""
+    schema = json.dumps(ProjectConfig.model_json_schema(), sort_keys=True)
+    digest = hashlib.sha256(schema.encode("utf-8")).hexdigest()[:16]
+    return f"{SCHEMA_VERSION}.{digest}"
 
 
 class StyleGuide(BaseModel):
@@ -46,9 +135,7 @@ class StyleGuide(BaseModel):
             normalized = value.strip().lower().replace(" ", "_")
             if normalized == "kurzgesagt-inspired":
                 normalized = "kurzgesagt"
-            for item in Aesthetic:
-                if item.value == normalized:
-                    return item
+            return _AESTHETIC_BY_VALUE.get(normalized, Aesthetic.KURZGESAGT)
         return Aesthetic.KURZGESAGT
 
 
@@ -87,6 +174,13 @@ class TechnicalSpecs(BaseModel):
         default=ImageAspectRatio.RATIO_1_1
     )
     image_resolution: ImageResolution = Field(default=ImageResolution.K1)
+    video_concurrency: Dict[str, int] = Field(
+        default_factory=dict,
+        description=(
+            "Per-stage batch video limits overriding the defaults "
+            "(submit/poll/save)"
+        ),
+    )
 
 
 class ProjectMetadata(BaseModel):
@@ -111,6 +205,8 @@ class ProjectConfig(BaseModel):
     voice_over_script: str = Field(default="", description="Raw voice-over script")
     scenes: List[Scene] = Field(default_factory=list, description="Generated scenes")
 
+    _scene_index: Optional[NumberIndex] = PrivateAttr(default=None)
+
     @property
     def total_duration(self) -> float:
         """Calculate total video duration including scene transitions."""
@@ -122,6 +218,17 @@ class ProjectConfig(BaseModel):
         total += self.scenes[-1].duration
         return total
 
+    def get_scene(self, number: int) -> Optional[Scene]:
+        """Get the scene with the given number, or ``None``.
+
+        Uses a number index kept until ``scenes`` is reassigned or changes
+        length. Replacing list items in place is not tracked.
+        """
+        scene, self._scene_index = lookup_by_number(
+            self.scenes, self._scene_index, number
+        )
+        return scene
+
     @property
     def scene_count(self) -> int:
         """Get number of scenes."""
@@ -138,22 +245,56 @@ class ProjectConfig(BaseModel):
 
     def to_yaml(self, path: Path) -> None:
         """Export configuration to YAML file."""
-        with open(path, "w", encoding="utf-8") as f:
-            yaml.safe_dump(
-                self.to_dict(),
-                f,
-                default_flow_style=False,
-                allow_unicode=True,
-                sort_keys=False,
-            )
+        payload = yaml.dump(
+            self.to_dict(),
+            Dumper=_YamlDumper,
+            default_flow_style=False,
+            allow_unicode=True,
+            sort_keys=False,
+        ).encode("utf-8")
+
+        path = Path(path)
+        path.write_bytes(payload)
+        # Lets from_yaml_trusted skip validation while the file and schema
+        # are unchanged
+        path.with_suffix(CHECKSUM_SUFFIX).write_text(
+            f"{_schema_tag()} {hashlib.sha256(payload).hexdigest()}", encoding="utf-8"
+        )
 
     @classmethod
     def from_yaml(cls, path: Path) -> "ProjectConfig":
         """Load configuration from YAML file."""
         with open(path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_YamlLoader)
         return cls(**data)
 
+    @classmethod
+    def from_yaml_trusted(cls, path: Path) -> "ProjectConfig":
+        """Load a file written by :meth:`to_yaml` without re-validating it.
+
+        The data was validated before it was saved, so while the YAML still
+        matches its checksum sidecar and was written under the current
+        schema, the models are rebuilt with ``model_construct``. A missing or
+        stale checksum (e.g. after a hand edit), a file saved before a schema
+        change, or data that doesn't fit the models falls back to
+        :meth:`from_yaml`.
+        """
+        path = Path(path)
+        payload = path.read_bytes()
+        try:
+            sidecar = path.with_suffix(CHECKSUM_SUFFIX).read_text(encoding="utf-8")
+        except OSError:
+            return cls.from_yaml(path)
+        expected = f"{_schema_tag()} {hashlib.sha256(payload).hexdigest()}"
+        if sidecar.strip() != expected:
+            return cls.from_yaml(path)
+
+        data = yaml.load(payload, Loader=_YamlLoader)
+        try:
+            return _construct_model(cls, data)
+        except (AttributeError, KeyError, TypeError, ValueError):
+            return cls.from_yaml(path)
+
     @classmethod
     def create_new(cls, title: str, author: Optional[str] = None) -> "ProjectConfig":
         """Create a new project with defaults."""
@@ -1,8 +1,77 @@
 """Scene and shot data models."""
 
-from typing import List, Optional
+import sys
+from itertools import accumulate
+from typing import (
+    Annotated,
+    Any,
+    ClassVar,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
-from pydantic import BaseModel, Field, field_validator
+from annotated_types import Ge, Le
+from pydantic import (
+    AfterValidator,
+    BaseModel,
+    BeforeValidator,
+    Field,
+    PrivateAttr,
+    TypeAdapter,
+    ValidationError,
+    model_validator,
+)
+
+# Shared constrained types so every model reuses the same bounds
+ShotDuration = Annotated[float, Ge(0.1), Le(60.0)]
+TransitionDuration = Annotated[float, Ge(0.0), Le(5.0)]
+
+# Coerces the legacy is_nested input with pydantic's usual bool rules
+_BOOL_ADAPTER: TypeAdapter[bool] = TypeAdapter(bool)
+
+# (list indexed, its length when built, number -> first item with that number)
+NumberIndex = Tuple[Sequence[Any], int, Dict[int, Any]]
+
+
+def lookup_by_number(
+    items: Sequence[Any], cached: Optional[NumberIndex], number: int
+) -> Tuple[Optional[Any], NumberIndex]:
+    """Find the first item in ``items`` whose ``number`` matches.
+
+    Serves hits from ``cached`` while it was built for this same list, the
+    length is unchanged and the entry still carries ``number``; otherwise,
+    and on a miss, the index is rebuilt. Returns the item (or ``None``) and
+    the index to keep.
+    """
+    if cached is not None and cached[0] is items and cached[1] == len(items):
+        item = cached[2].get(number)
+        if item is not None and item.number == number:
+            return item, cached
+
+    index: Dict[int, Any] = {}
+    for item in items:
+        index.setdefault(item.number, item)
+    return index.get(number), (items, len(items), index)
+
+
+def _transition_note(value: Any) -> Any:
+    """Map a missing note to "" and share one object per repeated label."""
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return sys.intern(value)
+    return value  # Let str validation reject it
+
+
+def _clean_elements(elements: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Strip key elements and drop the ones left empty."""
+    if not elements:
+        return elements
+    return tuple(elem for elem in (raw.strip() for raw in elements) if elem)
 
 
 class Shot(BaseModel):
@@ -12,49 +81,112 @@ class Shot(BaseModel):
     narration: str = Field(
         ..., min_length=1, description="Voice-over narration for this shot"
     )
-    duration: float = Field(..., ge=0.1, le=60.0, description="Shot duration in seconds (actual audio duration)")
+    duration: ShotDuration = Field(
+        ..., description="Shot duration in seconds (actual audio duration)"
+    )
     description: str = Field(
         ..., min_length=1, description="What this shot accomplishes"
     )
-    key_elements: List[str] = Field(
-        default_factory=list, description="Key visual elements"
-    )
+    key_elements: Annotated[
+        Tuple[str, ...], AfterValidator(_clean_elements)
+    ] = Field(default_factory=tuple, description="Key visual elements")
     image_prompt: str = Field(..., min_length=1, description="Text-to-image prompt")
     video_prompt: str = Field(..., min_length=1, description="Image-to-video prompt")
-    is_nested: bool = Field(
-        default=False, description="Whether shot contains nested camera moves"
+    flags: int = Field(
+        default=0, ge=0, description="Shot flag bits (see the FLAG_* constants)"
     )
-    transition_note: Optional[str] = Field(
-        None, description="How to transition to next shot"
+    # Empty means no note. Scripts reuse a handful of notes ("cut",
+    # "fade", ...) across many shots, so they are interned.
+    transition_note: Annotated[str, BeforeValidator(_transition_note)] = Field(
+        default="", description="How to transition to next shot"
     )
-    transition_duration: float = Field(
-        default=0.5, ge=0.0, le=5.0, description="Transition duration to next shot in seconds"
+    transition_duration: TransitionDuration = Field(
+        default=0.5, description="Transition duration to next shot in seconds"
     )
 
-    @field_validator("key_elements")
+    # Bits of ``flags``
+    FLAG_NESTED: ClassVar[int] = 1 << 0  # Nested camera moves
+
+    @model_validator(mode="before")
+    @classmethod
+    def fold_is_nested(cls, data: Any) -> Any:
+        """Accept the legacy ``is_nested`` bool from provider JSON and old files."""
+        if isinstance(data, dict) and "is_nested" in data:
+            data = dict(data)
+            try:
+                nested = _BOOL_ADAPTER.validate_python(data.pop("is_nested"))
+            except ValidationError as e:
+                raise ValueError(f"is_nested: {e.errors()[0]['msg']}") from None
+            flags = data.get("flags", 0)
+            if isinstance(flags, int):
+                bit = cls.FLAG_NESTED
+                data["flags"] = flags | bit if nested else flags & ~bit
+        return data
+
+    @property
+    def is_nested(self) -> bool:
+        """Whether the shot contains nested camera moves."""
+        return bool(self.flags & self.FLAG_NESTED)
+
+    @is_nested.setter
+    def is_nested(self, value: bool) -> None:
+        if value:
+            self.flags |= self.FLAG_NESTED
+        else:
+            self.flags &= ~self.FLAG_NESTED
+
     @classmethod
-    def validate_key_elements(cls, v: List[str]) -> List[str]:
-        """Ensure key elements are not empty strings."""
-        return [elem.strip() for elem in v if elem.strip()]
+    def from_json(cls, raw: Union[str, bytes]) -> "Shot":
+        """Parse and validate one shot from JSON in a single pass.
+
+        For arrays of shots use :func:`parse_shots_json`.
+        """
+        return cls.model_validate_json(raw)
+
+    @classmethod
+    def build_trusted(cls, **fields: Any) -> "Shot":
+        """Build a shot from already-validated data, skipping validation.
+
+        Callers must guarantee the field constraints hold (e.g. key elements
+        already stripped); nothing is checked or coerced.
+        """
+        return cls.model_construct(**fields)
 
 
 class Scene(BaseModel):
     """Represents a scene (collection of related shots)."""
 
     number: int = Field(..., ge=1, description="Scene number (1-indexed)")
-    title: str = Field(..., min_length=1, description="Scene title (uppercase)")
+    title: Annotated[str, AfterValidator(str.upper)] = Field(
+        ..., min_length=1, description="Scene title (uppercase)"
+    )
     purpose: str = Field(..., min_length=1, description="Narrative goal of this scene")
     duration: float = Field(..., ge=0.1, description="Total scene duration in seconds (actual)")
     shots: List[Shot] = Field(default_factory=list, description="Shots in this scene")
-    transition_duration: float = Field(
-        default=1.0, ge=0.0, le=5.0, description="Transition duration to next scene in seconds"
+    transition_duration: TransitionDuration = Field(
+        default=1.0, description="Transition duration to next scene in seconds"
     )
 
-    @field_validator("title")
+    # (shot count at the last calculation, (shot start offsets, total duration))
+    _timing_cache: Optional[
+        Tuple[int, Tuple[Tuple[float, ...], float]]
+    ] = PrivateAttr(default=None)
+    _shot_index: Optional[NumberIndex] = PrivateAttr(default=None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name == "shots":
+            self._timing_cache = None
+            self._shot_index = None
+
     @classmethod
-    def title_uppercase(cls, v: str) -> str:
-        """Ensure title is uppercase."""
-        return v.upper()
+    def build_trusted(cls, **fields: Any) -> "Scene":
+        """Build a scene from already-validated data, skipping validation.
+
+        ``shots`` must already be :class:`Shot` instances and ``title``
+        uppercase; nothing is checked or coerced.
+        """
+        return cls.model_construct(**fields)
 
     @property
     def shot_count(self) -> int:
@@ -64,13 +196,78 @@ class Scene(BaseModel):
     def add_shot(self, shot: Shot) -> None:
         """Add a shot to this scene."""
         self.shots.append(shot)
+        self._timing_cache = None
+
+    def reset_timing(self) -> None:
+        """Drop the cached timing after editing shots or ``shots`` in place."""
+        self._timing_cache = None
+
+    def get_shot(self, number: int) -> Optional[Shot]:
+        """Get the shot with the given number, or ``None``.
+
+        Uses a number index kept until ``shots`` is reassigned or changes
+        length. Replacing list items in place is not tracked.
+        """
+        shot, self._shot_index = lookup_by_number(
+            self.shots, self._shot_index, number
+        )
+        return shot
 
     def calculate_duration(self) -> float:
-        """Calculate total duration from shots including their transitions."""
-        if not self.shots:
-            return 0.0
-        # Sum all shot durations + their transition durations except the last shot's transition
-        total = sum(shot.duration + shot.transition_duration for shot in self.shots[:-1])
-        # Add last shot duration without transition
-        total += self.shots[-1].duration
-        return total
+        """Calculate total duration from shots including their transitions.
+
+        The result is cached until a shot is added, ``shots`` is reassigned
+        or the shot count changes. Other in-place edits (e.g.
+        ``scene.shots[0].duration = 4`` or replacing list items) are not
+        tracked; call :meth:`reset_timing` afterwards.
+        """
+        return self._timing()[1]
+
+    def timeline_offsets(self) -> Tuple[float, ...]:
+        """Start time of each shot in seconds, relative to the scene start.
+
+        Cached together with :meth:`calculate_duration`.
+        """
+        return self._timing()[0]
+
+    def _timing(self) -> Tuple[Tuple[float, ...], float]:
+        """Compute shot offsets and the scene duration in one pass."""
+        shots = self.shots
+        cached = self._timing_cache
+        if cached is not None and cached[0] == len(shots):
+            return cached[1]
+
+        if not shots:
+            timing: Tuple[Tuple[float, ...], float] = ((), 0.0)
+        else:
+            # Running sum of duration + transition; the final entry includes
+            # the last shot's transition, which doesn't count toward the scene
+            starts = tuple(
+                accumulate(
+                    (shot.duration + shot.transition_duration for shot in shots),
+                    initial=0.0,
+                )
+            )
+            timing = (starts[:-1], starts[-1] - shots[-1].transition_duration)
+        self._timing_cache = (len(shots), timing)
+        return timing
+
+    @staticmethod
+    def total_duration(scenes: List["Scene"]) -> float:
+        """Total shot-based duration of ``scenes``, excluding scene transitions.
+
+        Uses each scene's cached :meth:`calculate_duration`, so repeated
+        totals over unchanged scenes cost one lookup per scene.
+        """
+        return sum(scene.calculate_duration() for scene in scenes)
+
+
+# Built once per process; validating a whole list in one call avoids
+# rebuilding the validator per item
+SHOT_LIST_ADAPTER: TypeAdapter[List[Shot]] = TypeAdapter(List[Shot])
+SCENE_LIST_ADAPTER: TypeAdapter[List[Scene]] = TypeAdapter(List[Scene])
+
+
+def parse_shots_json(data: Union[str, bytes]) -> List[Shot]:
+    """Validate a JSON array of shots without a ``json.loads`` round-trip."""
+    return SHOT_LIST_ADAPTER.validate_json(data)
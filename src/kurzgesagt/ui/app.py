@@ -2,28 +2,38 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import logging
+import re
+import subprocess
 import sys
+import time
+import wave
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional, Tuple, Union
 
 import streamlit as st
 
+if TYPE_CHECKING:
+    from kurzgesagt.core import (
+        AudioGenerator,
+        PromptOptimizer,
+        SceneParser,
+        ScriptGenerator,
+    )
+    from kurzgesagt.core.image_generator import ImageGenerator
+
 ROOT_DIR = Path(__file__).resolve().parents[2]
 if str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
 
+# SDK-backed services are imported in their factories below, so the welcome
+# screen can render before the Anthropic/OpenAI/GenAI SDKs load
 from kurzgesagt.config import settings
-from kurzgesagt.core import (
-    AudioGenerator,
-    ProjectManager,
-    PromptOptimizer,
-    ResolveExporter,
-    SceneParser,
-    ScriptGenerator,
-    VideoGenerationError,
-)
-from kurzgesagt.core.image_generator import ImageGenerator
-from kurzgesagt.models import ProjectConfig
+from kurzgesagt.core import ProjectManager, ResolveExporter
+from kurzgesagt.models import ProjectConfig, Scene, Shot
 from kurzgesagt.models.enums import (
     Aesthetic,
     AspectRatio,
@@ -35,6 +45,8 @@ from kurzgesagt.models.enums import (
     MotionPacing,
     ShotComplexity,
 )
+from kurzgesagt.ui.choices import enum_format, enum_index, enum_options
+from kurzgesagt.ui.fingerprint import script_fingerprint
 from kurzgesagt.utils import (
     ValidationError,
     configure_logging,
@@ -47,9 +59,52 @@ from kurzgesagt.utils import (
     validate_voice_over_script,
 )
 
-configure_logging()
+
+@st.cache_resource(show_spinner=False)
+def _init_logging() -> logging.Logger:
+    """Configure logging once per process rather than on every rerun."""
+    return configure_logging()
+
+
+_init_logging()
 logger = get_logger("ui")
 
+# Concurrent image requests when generating all shots
+IMAGE_BATCH_WORKERS = 8
+# Concurrent TTS requests when generating the full narration
+TTS_BATCH_WORKERS = 5
+# PCM format the full narration is assembled in (OpenAI TTS native output)
+NARRATION_FRAME_RATE = 24000
+NARRATION_CHANNELS = 1
+NARRATION_SAMPLE_WIDTH = 2
+# Markers in the audio script preview built by _build_script_preview
+SCENE_HEADER_RE = re.compile(r"=== SCENE (\d+): (.+?) ===\n")
+SCENE_PAUSE_RE = re.compile(r"\n\[PAUSE [\d.]+s\]\n")
+SHOT_PAUSE_RE = re.compile(r"\n\n\[PAUSE [\d.]+s\]\n\n")
+# Minimum seconds between batch status label updates
+STATUS_UPDATE_INTERVAL = 0.25
+# Documents offered on the Generate tab, by generate_and_download type
+DOCUMENT_LABELS = {
+    "setup": "📋 Project Setup",
+    "confirmations": "✅ Confirmations",
+    "script": "🎬 Full Script",
+}
+# Largest script file accepted by the images tab upload
+SCRIPT_UPLOAD_MAX_BYTES = 1024 * 1024
+# Widget keys whose values must survive while their tab is not drawn.
+# These widgets take no value=/index= default; they are seeded from
+# session state instead, so re-assigning the key doesn't conflict.
+TAB_PERSISTED_KEYS = (
+    "voice_over_text",
+    "image_source_text",
+    "image_generate_select",
+    "audio_section_pause",
+    "audio_shot_pause",
+    "audio_script_preview",
+    "scene_selector_video",
+    "individual_shot_selector",
+)
+
 # Page configuration
 st.set_page_config(
     page_title="Kurzgesagt Script Generator",
@@ -67,48 +122,147 @@ st.markdown(
         font-weight: bold;
         margin-bottom: 1rem;
     }
-    .success-box {
-        padding: 1rem;
-        border-radius: 0.5rem;
-        background-color: #d4edda;
-        border: 1px solid #c3e6cb;
-        color: #155724;
-    }
-    .error-box {
-        padding: 1rem;
-        border-radius: 0.5rem;
-        background-color: #f8d7da;
-        border: 1px solid #f5c6cb;
-        color: #721c24;
-    }
 </style>
 """,
     unsafe_allow_html=True,
 )
 
 
+# Shared, stateless services: one instance (and one HTTP client) per server
+# process instead of per browser session. A constructor that raises is not
+# cached, so fixing the configuration takes effect on the next rerun.
+@st.cache_resource(show_spinner=False)
+def get_project_manager() -> ProjectManager:
+    """Get the process-wide project manager."""
+    return ProjectManager()
+
+
+@st.cache_resource(show_spinner=False)
+def get_script_generator() -> ScriptGenerator:
+    """Get the process-wide script generator."""
+    from kurzgesagt.core import ScriptGenerator
+
+    return ScriptGenerator()
+
+
+@st.cache_resource(show_spinner=False)
+def get_scene_parser() -> SceneParser:
+    """Get the process-wide scene parser."""
+    from kurzgesagt.core import SceneParser
+
+    return SceneParser()
+
+
+@st.cache_resource(show_spinner=False)
+def get_prompt_optimizer() -> PromptOptimizer:
+    """Get the process-wide prompt optimizer."""
+    from kurzgesagt.core import PromptOptimizer
+
+    return PromptOptimizer()
+
+
+@st.cache_resource(show_spinner=False)
+def get_audio_generator() -> AudioGenerator:
+    """Get the process-wide audio generator."""
+    from kurzgesagt.core import AudioGenerator
+    from kurzgesagt.core.audio_generator import TTS_CACHE_DIR
+
+    return AudioGenerator(cache_dir=settings.projects_dir / TTS_CACHE_DIR)
+
+
+@st.cache_resource(show_spinner=False)
+def get_image_generator() -> ImageGenerator:
+    """Get the process-wide image generator."""
+    from kurzgesagt.core.image_generator import ImageGenerator
+
+    return ImageGenerator()
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _list_projects_cached(
+    base_path: str, _project_manager: ProjectManager
+) -> List[str]:
+    """List projects, reusing the result across reruns for a short while.
+
+    Keyed on the projects directory; call ``.clear()`` after creating or
+    deleting a project.
+    """
+    return _project_manager.list_projects()
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _script_stats(text: str) -> Tuple[int, int]:
+    """Word count and estimated reading time (seconds) of a script.
+
+    Cached on the text so reruns that don't edit the script skip both scans.
+    """
+    return len(text.split()), estimate_reading_time(text)
+
+
+def _bump_config_rev() -> None:
+    """Record that the scenes changed, so cached documents are re-rendered."""
+    st.session_state.config_rev += 1
+
+
+def _document_key(config: ProjectConfig) -> str:
+    """Cheap fingerprint of everything the production documents render.
+
+    The script goes through :func:`script_fingerprint` and the scenes are
+    covered by ``config_rev``, so shots are never serialized; the remaining
+    sections are a handful of fields and are dumped as is.
+    """
+    return "|".join(
+        (
+            st.session_state.current_project or "",
+            script_fingerprint(config.voice_over_script),
+            str(st.session_state.config_rev),
+            config.model_dump_json(exclude={"scenes", "voice_over_script"}),
+        )
+    )
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _generate_document(
+    fingerprint: str,
+    doc_type: str,
+    _generator: ScriptGenerator,
+    _config: ProjectConfig,
+) -> str:
+    """Render one production document, reusing it while the config is unchanged.
+
+    Keyed on :func:`_document_key`, so any edit to the project produces a
+    fresh document; ``_generator`` and ``_config`` are not hashed.
+    """
+    render = {
+        "setup": _generator.generate_project_setup,
+        "confirmations": _generator.generate_confirmations,
+        "script": _generator.generate_script,
+    }[doc_type]
+    return render(_config)
+
+
 # Initialize session state
 def init_session_state() -> None:
     """Initialize Streamlit session state."""
     if "project_manager" not in st.session_state:
-        st.session_state.project_manager = ProjectManager()
+        st.session_state.project_manager = get_project_manager()
 
     if "script_generator" not in st.session_state:
-        st.session_state.script_generator = ScriptGenerator()
+        st.session_state.script_generator = get_script_generator()
 
     if "scene_parser" not in st.session_state:
         try:
-            st.session_state.scene_parser = SceneParser()
+            st.session_state.scene_parser = get_scene_parser()
         except Exception as e:
             st.warning(f"Scene parser not configured: {e}")
             st.session_state.scene_parser = None
 
     if "prompt_optimizer" not in st.session_state:
-        st.session_state.prompt_optimizer = PromptOptimizer()
+        st.session_state.prompt_optimizer = get_prompt_optimizer()
 
     if "audio_generator" not in st.session_state:
         try:
-            st.session_state.audio_generator = AudioGenerator()
+            st.session_state.audio_generator = get_audio_generator()
         except Exception as e:
             st.warning(f"Audio generator not configured: {e}")
             st.session_state.audio_generator = None
@@ -125,6 +279,9 @@ def init_session_state() -> None:
     if "last_parse" not in st.session_state:
         st.session_state.last_parse = None
 
+    if "config_rev" not in st.session_state:
+        st.session_state.config_rev = 0
+
     if "last_voice_over_hash" not in st.session_state:
         st.session_state.last_voice_over_hash = None
 
@@ -207,12 +364,17 @@ def render_new_project_form() -> None:
                     title=project_title, author=safe_author
                 )
 
+                _list_projects_cached.clear()
+
                 # Set as current
                 st.session_state.current_project = project_name
                 st.session_state.config = config
+                st.session_state.last_parse = None
+                _bump_config_rev()
 
-                st.success(f"✅ Created project: {project_name}")
-                st.rerun()
+                # The sidebar and main area render after this form, so they
+                # pick up the new project in this run without st.rerun()
+                st.toast(f"✅ Created project: {project_name}")
 
             except ValidationError as e:
                 st.error(f"❌ {str(e)}")
@@ -222,7 +384,8 @@ def render_new_project_form() -> None:
 
 def render_load_project_form() -> None:
     """Render form for loading existing project."""
-    projects = st.session_state.project_manager.list_projects()
+    project_manager = st.session_state.project_manager
+    projects = _list_projects_cached(str(project_manager.base_path), project_manager)
 
     if not projects:
         st.info("No projects found. Create a new one!")
@@ -237,8 +400,9 @@ def render_load_project_form() -> None:
             config = st.session_state.project_manager.load(selected)
             st.session_state.current_project = selected
             st.session_state.config = config
-            st.success(f"✅ Loaded: {selected}")
-            st.rerun()
+            st.session_state.last_parse = None
+            _bump_config_rev()
+            st.toast(f"✅ Loaded: {selected}")
         except Exception as e:
             st.error(f"❌ Failed to load project: {str(e)}")
 
@@ -273,19 +437,20 @@ def update_shot_video_prompt(
     """
     try:
         # Find the scene
-        scene = next((s for s in config.scenes if s.number == scene_number), None)
+        scene = config.get_scene(scene_number)
         if not scene:
             logger.error(f"Scene {scene_number} not found")
             return False
 
         # Find the shot
-        shot = next((s for s in scene.shots if s.number == shot_number), None)
+        shot = scene.get_shot(shot_number)
         if not shot:
             logger.error(f"Shot {shot_number} not found in scene {scene_number}")
             return False
 
         # Update the video prompt
         shot.video_prompt = new_prompt
+        _bump_config_rev()
         logger.info(f"Updated video prompt for Scene {scene_number} Shot {shot_number}")
         return True
 
@@ -301,8 +466,11 @@ def delete_current_project() -> None:
     if confirm and st.button("Confirm Delete"):
         try:
             st.session_state.project_manager.delete(st.session_state.current_project)
+            _list_projects_cached.clear()
             st.session_state.current_project = None
             st.session_state.config = None
+            st.session_state.last_parse = None
+            _bump_config_rev()
             st.success("✅ Project deleted")
             st.rerun()
         except Exception as e:
@@ -336,47 +504,35 @@ def render_main_interface() -> None:
     """Render main project interface."""
     config = st.session_state.config
 
-    # Tabs
-    tab1, tab2, tab3, tab4, tab5, tab6, tab7, tab8, tab9 = st.tabs(
-        [
-            "⚙️ Settings",
-            "📋 Overview",
-            "🎨 Style",
-            "🎬 Script",
-            "📄 Generate",
-            "🖼 Images",
-            "🎙️ Audio",
-            "🎥 Img2Video",
-            "📤 Export",
-        ]
-    )
-
-    with tab1:
-        render_settings_tab(config)
-
-    with tab2:
-        render_overview_tab(config)
-
-    with tab3:
-        render_style_tab(config)
-
-    with tab4:
-        render_script_tab(config)
-
-    with tab5:
-        render_generate_tab(config)
-
-    with tab6:
-        render_images_tab(config)
-
-    with tab7:
-        render_audio_tab(config)
+    tabs = {
+        "⚙️ Settings": render_settings_tab,
+        "📋 Overview": render_overview_tab,
+        "🎨 Style": render_style_tab,
+        "🎬 Script": render_script_tab,
+        "📄 Generate": render_generate_tab,
+        "🖼 Images": render_images_tab,
+        "🎙️ Audio": render_audio_tab,
+        "🎥 Img2Video": render_img2video_tab,
+        "📤 Export": render_export_tab,
+    }
 
-    with tab8:
-        render_img2video_tab(config)
+    # Streamlit drops a keyed widget's value on any run where the widget
+    # isn't drawn; re-assigning it keeps it across visits to other tabs
+    for key in TAB_PERSISTED_KEYS:
+        if key in st.session_state:
+            st.session_state[key] = st.session_state[key]
+
+    # st.tabs would build every tab on each rerun; only draw the chosen one
+    active_tab = st.radio(
+        "View",
+        list(tabs),
+        horizontal=True,
+        label_visibility="collapsed",
+        key="active_tab",
+    )
+    st.divider()
 
-    with tab9:
-        render_export_tab(config)
+    tabs[active_tab](config)
 
 
 def render_overview_tab(config: ProjectConfig) -> None:
@@ -404,6 +560,9 @@ def render_overview_tab(config: ProjectConfig) -> None:
     st.write(f"**Updated:** {config.metadata.updated_at.strftime('%Y-%m-%d %H:%M')}")
 
 
+# Style widgets only edit config.style, so interacting with them reruns just
+# this tab; other tabs read the style on their own (full) reruns
+@st.fragment
 def render_style_tab(config: ProjectConfig) -> None:
     """Render style configuration."""
     st.header("Visual Style Configuration")
@@ -415,24 +574,24 @@ def render_style_tab(config: ProjectConfig) -> None:
 
         config.style.aesthetic = st.selectbox(
             "Aesthetic",
-            options=list(Aesthetic),
-            format_func=lambda x: x.value.replace("_", " ").title(),
-            index=list(Aesthetic).index(config.style.aesthetic),
+            options=enum_options(Aesthetic),
+            format_func=enum_format(Aesthetic),
+            index=enum_index(config.style.aesthetic),
         )
         st.caption(config.style.aesthetic.description)
 
         config.style.color_palette = st.selectbox(
             "Color Palette",
-            options=list(ColorPalette),
-            format_func=lambda x: x.value.capitalize(),
-            index=list(ColorPalette).index(config.style.color_palette),
+            options=enum_options(ColorPalette),
+            format_func=enum_format(ColorPalette, str.capitalize),
+            index=enum_index(config.style.color_palette),
         )
 
         config.style.line_work = st.selectbox(
             "Line Work",
-            options=list(LineWork),
-            format_func=lambda x: x.value.replace("_", " ").title(),
-            index=list(LineWork).index(config.style.line_work),
+            options=enum_options(LineWork),
+            format_func=enum_format(LineWork),
+            index=enum_index(config.style.line_work),
         )
 
     with col2:
@@ -440,9 +599,9 @@ def render_style_tab(config: ProjectConfig) -> None:
 
         config.style.motion_pacing = st.selectbox(
             "Motion Pacing",
-            options=list(MotionPacing),
-            format_func=lambda x: x.value.capitalize(),
-            index=list(MotionPacing).index(config.style.motion_pacing),
+            options=enum_options(MotionPacing),
+            format_func=enum_format(MotionPacing, str.capitalize),
+            index=enum_index(config.style.motion_pacing),
         )
 
         gradients_input = st.text_input(
@@ -493,8 +652,7 @@ def render_script_tab(config: ProjectConfig) -> None:
         st.error(str(e))
 
     if config.voice_over_script:
-        word_count = len(config.voice_over_script.split())
-        est_duration = estimate_reading_time(config.voice_over_script)
+        word_count, est_duration = _script_stats(config.voice_over_script)
 
         col1, col2 = st.columns(2)
         col1.metric("Word Count", word_count)
@@ -510,24 +668,40 @@ def render_script_tab(config: ProjectConfig) -> None:
             "⚠️ Scene parser not configured. Set ANTHROPIC_API_KEY or OPENAI_API_KEY in .env."
         )
     else:
-        if st.button("Parse Script into Scenes", type="primary"):
+        col_parse, col_reparse = st.columns([1, 1])
+        with col_parse:
+            parse_clicked = st.button("Parse Script into Scenes", type="primary")
+        with col_reparse:
+            # Parsing is not deterministic; let users re-roll unchanged inputs
+            reparse_clicked = st.button(
+                "🔄 Re-parse anyway",
+                disabled=not config.scenes,
+                help="Parse again even if the script and style are unchanged",
+            )
+        if parse_clicked or reparse_clicked:
             if not config.voice_over_script:
                 st.error("Please add a voice-over script first")
             else:
-                parse_script_with_claude(config)
+                parse_script_with_claude(config, force=reparse_clicked)
 
     if config.scenes:
         st.divider()
         st.subheader("📌 Parsed Scenes Preview")
         with st.expander("View scenes", expanded=False):
+            # One markdown element for the whole list instead of one per line
+            blocks = []
             for scene in config.scenes:
-                st.markdown(
-                    f"**Scene {scene.number}:** {scene.title} (Shots: {scene.shot_count})"
+                lines = [
+                    f"**Scene {scene.number}:** {scene.title} "
+                    f"(Shots: {scene.shot_count})",
+                    "",
+                ]
+                lines.extend(
+                    f"- Shot {shot.number}: {shot.narration[:120]}"
+                    for shot in scene.shots
                 )
-                for shot in scene.shots:
-                    st.markdown(
-                        f"- Shot {shot.number}: {shot.narration[:120]}"
-                    )
+                blocks.append("\n".join(lines))
+            st.markdown("\n\n".join(blocks))
 
 
 def _check_script_sync(config: ProjectConfig) -> bool:
@@ -542,19 +716,50 @@ def _check_script_sync(config: ProjectConfig) -> bool:
     if not st.session_state.last_voice_over_hash:
         return True
 
-    import hashlib
-    current_hash = hashlib.md5(config.voice_over_script.encode()).hexdigest()
+    current_hash = script_fingerprint(config.voice_over_script)
     return current_hash == st.session_state.last_voice_over_hash
 
 
-def parse_script_with_claude(config: ProjectConfig) -> None:
-    """Parse script using Claude API."""
+def _parse_key(config: ProjectConfig) -> str:
+    """Fingerprint the inputs that determine the parsed scenes."""
+    payload = "|".join(
+        (
+            st.session_state.current_project or "",
+            config.voice_over_script,
+            config.style.model_dump_json(),
+            config.technical.shot_complexity.value,
+        )
+    )
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+def parse_script_with_claude(config: ProjectConfig, force: bool = False) -> None:
+    """Parse script using Claude API.
+
+    Unless ``force`` is set, the provider call is skipped when the current
+    scenes came from a parse of the same script and style.
+    """
     try:
         validate_voice_over_script(config.voice_over_script)
     except ValidationError as e:
         st.error(str(e))
         return
 
+    # Skip the provider call when the scenes already come from these inputs
+    parse_key = _parse_key(config)
+    last_parse = st.session_state.last_parse
+    if (
+        not force
+        and config.scenes
+        and last_parse
+        and last_parse.get("parse_key") == parse_key
+    ):
+        st.info(
+            "Scenes are already up to date with this script and style. "
+            "Use '🔄 Re-parse anyway' to generate new scenes."
+        )
+        return
+
     with st.spinner("Parsing script with selected provider..."):
         try:
             scenes = st.session_state.scene_parser.parse_script(
@@ -564,23 +769,24 @@ def parse_script_with_claude(config: ProjectConfig) -> None:
             )
 
             config.scenes = scenes
-            st.session_state.config = config
+            _bump_config_rev()
 
             # Store hash of voice-over script to track changes
-            import hashlib
-            script_hash = hashlib.md5(config.voice_over_script.encode()).hexdigest()
+            script_hash = script_fingerprint(config.voice_over_script)
             st.session_state.last_voice_over_hash = script_hash
 
             # Reset audio preview text since scenes have changed
             if "audio_script_preview_text" in st.session_state:
                 del st.session_state.audio_script_preview_text
+            st.session_state.pop("audio_script_preview", None)
 
+            shot_total = config.shot_count
             st.session_state.last_parse = {
                 "scene_count": len(scenes),
-                "shot_count": sum(scene.shot_count for scene in scenes),
+                "shot_count": shot_total,
                 "script_hash": script_hash,
+                "parse_key": parse_key,
             }
-            shot_total = sum(scene.shot_count for scene in scenes)
             st.success(
                 f"✅ Generated {len(scenes)} scenes with {shot_total} shots!"
             )
@@ -590,8 +796,13 @@ def parse_script_with_claude(config: ProjectConfig) -> None:
             st.error(f"❌ Parsing failed: {str(e)}")
 
 
+@st.fragment
 def render_generate_tab(config: ProjectConfig) -> None:
-    """Render script generation interface."""
+    """Render script generation interface.
+
+    A fragment: its buttons only produce output inside this tab, so
+    clicking them skips re-rendering the rest of the app.
+    """
     st.header("Generate Production Documents")
 
     if not config.scenes:
@@ -607,22 +818,22 @@ def render_generate_tab(config: ProjectConfig) -> None:
         )
 
     st.caption(
-        f"Scenes: {len(config.scenes)} • Shots: {sum(scene.shot_count for scene in config.scenes)}"
+        f"Scenes: {config.scene_count} • Shots: {config.shot_count}"
     )
 
-    col1, col2, col3 = st.columns(3)
-
-    with col1:
-        if st.button("📋 Project Setup", width='stretch'):
-            generate_and_download(config, "setup")
-
-    with col2:
-        if st.button("✅ Confirmations", width='stretch'):
-            generate_and_download(config, "confirmations")
+    # The preview and download button can't live inside a form, so the
+    # document is generated after it
+    with st.form("generate_document_form"):
+        doc_type = st.radio(
+            "Document",
+            options=list(DOCUMENT_LABELS),
+            format_func=DOCUMENT_LABELS.__getitem__,
+            horizontal=True,
+        )
+        submitted = st.form_submit_button("Generate", width='stretch')
 
-    with col3:
-        if st.button("🎬 Full Script", width='stretch'):
-            generate_and_download(config, "script")
+    if submitted:
+        generate_and_download(config, doc_type)
 
     st.divider()
 
@@ -667,11 +878,13 @@ def render_images_tab(config: ProjectConfig) -> None:
             assets_dir = ensure_directory(project_dir / "assets")
             suffix = Path(reference_upload.name).suffix.lower() or ".png"
             reference_path = assets_dir / f"style_reference{suffix}"
-            reference_path.write_bytes(reference_upload.read())
+            # UploadedFile is an in-memory BytesIO; write its buffer directly
+            # rather than copying it out with read()
+            with reference_upload.getbuffer() as view:
+                reference_path.write_bytes(view)
             config.style.reference_image_path = str(
                 Path("assets") / reference_path.name
             )
-            st.session_state.config = config
             st.success(f"✅ Saved reference image to {reference_path}")
         except Exception as exc:
             st.error(f"❌ Failed to save reference image: {exc}")
@@ -686,7 +899,6 @@ def render_images_tab(config: ProjectConfig) -> None:
             key="style_reference_clear",
         ):
             config.style.reference_image_path = None
-            st.session_state.config = config
             st.rerun()
 
     st.divider()
@@ -697,12 +909,24 @@ def render_images_tab(config: ProjectConfig) -> None:
         help="Upload the full script or voice-over text.",
     )
 
-    if uploaded is not None:
-        try:
-            file_text = uploaded.read().decode("utf-8", errors="ignore")
-            st.session_state.image_source_text = file_text
-        except Exception as exc:
-            st.error(f"❌ Failed to read upload: {exc}")
+    # Read each upload once; later reruns keep any edits made in the text area
+    if (
+        uploaded is not None
+        and st.session_state.get("image_source_upload_id") != uploaded.file_id
+    ):
+        if uploaded.size > SCRIPT_UPLOAD_MAX_BYTES:
+            st.error(
+                f"❌ Script file is too large "
+                f"(limit {SCRIPT_UPLOAD_MAX_BYTES // 1024} KB)"
+            )
+        else:
+            try:
+                with uploaded.getbuffer() as view:
+                    file_text = str(view, "utf-8", errors="ignore")
+                st.session_state.image_source_text = file_text
+                st.session_state.image_source_upload_id = uploaded.file_id
+            except Exception as exc:
+                st.error(f"❌ Failed to read upload: {exc}")
 
     source_text = st.text_area(
         "Script for image generation",
@@ -730,9 +954,12 @@ def render_images_tab(config: ProjectConfig) -> None:
                     )
                     config.scenes = scenes
                     config.voice_over_script = source_text
-                    st.session_state.config = config
+                    _bump_config_rev()
+                    # These scenes didn't come from the Script tab's parse
+                    st.session_state.last_parse = None
                     st.success(
-                        f"✅ Parsed {len(scenes)} scenes with {sum(scene.shot_count for scene in scenes)} shots."
+                        f"✅ Parsed {config.scene_count} scenes with "
+                        f"{config.shot_count} shots."
                     )
                 except Exception as exc:
                     st.error(f"❌ Parsing failed: {exc}")
@@ -802,15 +1029,14 @@ def render_images_tab(config: ProjectConfig) -> None:
         generate_selected_image(config, int(selected_index))
 
     with st.expander("View image generation prompts", expanded=False):
-        prompt_lines = []
-        for scene in config.scenes:
-            for shot in scene.shots:
-                prompt_lines.append(
-                    f"Scene {scene.number} Shot {shot.number}: {shot.image_prompt}"
-                )
+        prompts_text = "\n\n".join(
+            f"Scene {scene.number} Shot {shot.number}: {shot.image_prompt}"
+            for scene in config.scenes
+            for shot in scene.shots
+        )
         st.text_area(
             "Image Prompts",
-            value="\n\n".join(prompt_lines) if prompt_lines else "",
+            value=prompts_text,
             height=300,
             label_visibility="collapsed",
             key="image_prompt_preview_images_tab",
@@ -825,16 +1051,14 @@ def generate_and_download(config: ProjectConfig, doc_type: str) -> None:
 
         if doc_type == "setup":
             status.update(label="Generating project setup...", state="running")
-            content = generator.generate_project_setup(config)
-            filename = f"{st.session_state.current_project}_setup.md"
         elif doc_type == "confirmations":
             status.update(label="Generating confirmations...", state="running")
-            content = generator.generate_confirmations(config)
-            filename = f"{st.session_state.current_project}_confirmations.md"
         else:  # script
             status.update(label="Generating full script...", state="running")
-            content = generator.generate_script(config)
-            filename = f"{st.session_state.current_project}_script.md"
+        content = _generate_document(
+            _document_key(config), doc_type, generator, config
+        )
+        filename = f"{st.session_state.current_project}_{doc_type}.md"
 
         st.session_state.last_generated = {
             "doc_type": doc_type,
@@ -907,7 +1131,9 @@ def _load_reference_image_payload(
     if not image_path.is_absolute():
         image_path = project_dir / image_path
 
-    if not image_path.exists():
+    try:
+        stat = image_path.stat()
+    except OSError:
         return None, None
 
     suffix = image_path.suffix.lower()
@@ -917,7 +1143,23 @@ def _load_reference_image_payload(
     elif suffix == ".webp":
         mime = "image/webp"
 
-    return image_path.read_bytes(), mime
+    return _read_reference_image(str(image_path), stat.st_mtime_ns, stat.st_size), mime
+
+
+@st.cache_resource(max_entries=4, show_spinner=False)
+def _read_reference_image(path: str, mtime_ns: int, size: int) -> bytes:
+    """Read a reference image once per file version.
+
+    ``mtime_ns`` and ``size`` only key the cache, so replacing the file
+    triggers a fresh read. ``cache_resource`` hands back the same immutable
+    bytes instead of unpickling a copy on every hit.
+    """
+    return Path(path).read_bytes()
+
+
+def _shot_pairs(config: ProjectConfig) -> List[Tuple[Scene, Shot]]:
+    """Every shot with its scene, in script order."""
+    return [(scene, shot) for scene in config.scenes for shot in scene.shots]
 
 
 def generate_scene_images(config: ProjectConfig) -> None:
@@ -928,7 +1170,7 @@ def generate_scene_images(config: ProjectConfig) -> None:
 
     status = st.status("Generating scene images...", expanded=False)
     try:
-        generator = ImageGenerator()
+        generator = get_image_generator()
     except Exception as e:
         status.update(label="Image generator not configured", state="error")
         st.error(f"❌ {str(e)}")
@@ -938,40 +1180,63 @@ def generate_scene_images(config: ProjectConfig) -> None:
         settings.projects_dir, st.session_state.current_project
     )
     reference_payload = _load_reference_image_payload(config, project_dir)
-    total_shots = sum(len(scene.shots) for scene in config.scenes)
+    tasks = [(scene.number, shot) for scene, shot in _shot_pairs(config)]
+    total_shots = len(tasks)
     progress = st.progress(0.0)
     completed = 0
 
+    status.update(
+        label=f"Generating {total_shots} images "
+        f"(up to {IMAGE_BATCH_WORKERS} at a time)...",
+        state="running",
+    )
+    # Image requests are independent network calls; run them on a pool and
+    # update Streamlit elements only from this thread as each one finishes.
+    executor = ThreadPoolExecutor(
+        max_workers=max(1, min(IMAGE_BATCH_WORKERS, total_shots))
+    )
     try:
-        for scene in config.scenes:
-            for shot in scene.shots:
+        futures = {
+            executor.submit(
+                generator.save_shot_image,
+                project_dir=project_dir,
+                scene_number=scene_number,
+                shot_number=shot.number,
+                prompt=shot.image_prompt,
+                model=config.technical.image_model,
+                aspect_ratio=config.technical.image_aspect_ratio.value,
+                resolution=config.technical.image_resolution.value,
+                style_context=config.style.aesthetic.description,
+                reference_image_bytes=reference_payload[0],
+                reference_image_mime=reference_payload[1],
+            ): (scene_number, shot.number)
+            for scene_number, shot in tasks
+        }
+        last_label_at = 0.0
+        for future in as_completed(futures):
+            scene_number, shot_number = futures[future]
+            future.result()
+            completed += 1
+            # Shots finishing together would each send a label; keep the
+            # progress bar exact and refresh the label at most every interval
+            now = time.monotonic()
+            if now - last_label_at >= STATUS_UPDATE_INTERVAL:
+                last_label_at = now
                 status.update(
-                    label=(
-                        f"Generating Scene {scene.number}, Shot {shot.number}"
-                    ),
+                    label=f"Generated Scene {scene_number}, Shot {shot_number} "
+                    f"({completed}/{total_shots})",
                     state="running",
                 )
-                generator.save_shot_image(
-                    project_dir=project_dir,
-                    scene_number=scene.number,
-                    shot_number=shot.number,
-                    prompt=shot.image_prompt,
-                    model=config.technical.image_model,
-                    aspect_ratio=config.technical.image_aspect_ratio.value,
-                    resolution=config.technical.image_resolution.value,
-                    style_context=config.style.aesthetic.description,
-                    reference_image_bytes=reference_payload[0],
-                    reference_image_mime=reference_payload[1],
-                )
-                completed += 1
-                if total_shots:
-                    progress.progress(completed / total_shots)
+            progress.progress(completed / total_shots)
 
         status.update(label="Image generation complete", state="complete")
         st.success(f"✅ Saved images to {project_dir / 'images'}")
     except Exception as e:
         status.update(label="Image generation failed", state="error")
         st.error(f"❌ Image generation failed: {str(e)}")
+    finally:
+        # Don't start queued shots after a failure; in-flight ones finish
+        executor.shutdown(wait=False, cancel_futures=True)
 
 
 def generate_first_image(config: ProjectConfig) -> None:
@@ -982,7 +1247,7 @@ def generate_first_image(config: ProjectConfig) -> None:
 
     status = st.status("Generating first image...", expanded=False)
     try:
-        generator = ImageGenerator()
+        generator = get_image_generator()
     except Exception as e:
         status.update(label="Image generator not configured", state="error")
         st.error(f"❌ {str(e)}")
@@ -1021,19 +1286,19 @@ def generate_selected_image(config: ProjectConfig, index: int) -> None:
         st.warning("⚠️ No scenes defined. Parse your script first.")
         return
 
-    shots = [shot for scene in config.scenes for shot in scene.shots]
-    if not shots:
+    pairs = _shot_pairs(config)
+    if not pairs:
         st.warning("⚠️ No shots defined. Parse your script first.")
         return
 
-    total = len(shots)
+    total = len(pairs)
     if index < 1 or index > total:
         st.warning(f"⚠️ Select a value between 1 and {total}.")
         return
 
     status = st.status("Generating selected image...", expanded=False)
     try:
-        generator = ImageGenerator()
+        generator = get_image_generator()
     except Exception as e:
         status.update(label="Image generator not configured", state="error")
         st.error(f"❌ {str(e)}")
@@ -1044,25 +1309,9 @@ def generate_selected_image(config: ProjectConfig, index: int) -> None:
     )
     reference_payload = _load_reference_image_payload(config, project_dir)
 
-    try:
-        running = 0
-        selected_scene = None
-        selected_shot = None
-        for scene in config.scenes:
-            for shot in scene.shots:
-                running += 1
-                if running == index:
-                    selected_scene = scene
-                    selected_shot = shot
-                    break
-            if selected_shot is not None:
-                break
-
-        if not selected_scene or not selected_shot:
-            status.update(label="Image generation failed", state="error")
-            st.error("❌ Unable to resolve selected shot.")
-            return
+    selected_scene, selected_shot = pairs[index - 1]
 
+    try:
         image_path = generator.save_shot_image(
             project_dir=project_dir,
             scene_number=selected_scene.number,
@@ -1143,6 +1392,8 @@ def render_audio_tab(config: ProjectConfig) -> None:
 
     # Pause duration settings
     st.subheader("Pause Durations")
+    st.session_state.setdefault("audio_section_pause", 2.0)
+    st.session_state.setdefault("audio_shot_pause", 1.0)
     col1, col2 = st.columns(2)
 
     with col1:
@@ -1150,7 +1401,6 @@ def render_audio_tab(config: ProjectConfig) -> None:
             "Break between sections (seconds)",
             min_value=0.0,
             max_value=5.0,
-            value=2.0,
             step=0.5,
             help="Duration of silence between different scenes/sections",
             key="audio_section_pause"
@@ -1161,7 +1411,6 @@ def render_audio_tab(config: ProjectConfig) -> None:
             "Break between shots (seconds)",
             min_value=0.0,
             max_value=3.0,
-            value=1.0,
             step=0.25,
             help="Duration of silence between shots within a scene",
             key="audio_shot_pause"
@@ -1187,10 +1436,15 @@ def render_audio_tab(config: ProjectConfig) -> None:
             config, shot_pause, section_pause
         )
 
+    # Seed the widget once; passing value= as well would resend the whole
+    # script to the browser on every rerun
+    st.session_state.setdefault(
+        "audio_script_preview", st.session_state.audio_script_preview_text
+    )
+
     # Allow editing of the script preview
     edited_script = st.text_area(
         "Script with Pauses",
-        value=st.session_state.audio_script_preview_text,
         height=400,
         help="This shows the narration with [PAUSE] markers indicating silence. You can edit this text.",
         key="audio_script_preview",
@@ -1203,21 +1457,22 @@ def render_audio_tab(config: ProjectConfig) -> None:
     # Add button to reset to original parsed script
     col_reset1, col_reset2, col_reset3 = st.columns([1, 1, 2])
     with col_reset1:
-        if st.button("🔄 Reset to Parsed Script", help="Reset to the original parsed script from scenes"):
-            st.session_state.audio_script_preview_text = _build_script_preview(
-                config, shot_pause, section_pause
-            )
-            st.rerun()
+        st.button(
+            "🔄 Reset to Parsed Script",
+            help="Reset to the original parsed script from scenes",
+            on_click=_reset_script_preview,
+            args=(config, shot_pause, section_pause),
+        )
 
     with col_reset2:
         if st.button("💾 Save Changes to Project", help="Update the scene narration with edited text"):
             if _update_scenes_from_preview(config, edited_script):
                 st.success("✅ Scene narration updated successfully!")
-                st.session_state.config = config
                 # Update the hash since we've manually edited
-                import hashlib
-                script_hash = hashlib.md5(config.voice_over_script.encode()).hexdigest()
+                script_hash = script_fingerprint(config.voice_over_script)
                 st.session_state.last_voice_over_hash = script_hash
+                # Scenes no longer match the last parse, so allow a re-parse
+                st.session_state.last_parse = None
                 st.rerun()
             else:
                 st.error("❌ Failed to update scenes. Check the format.")
@@ -1275,7 +1530,6 @@ def render_audio_tab(config: ProjectConfig) -> None:
     selectable_items = []
     for scene_info in scene_data:
         scene_narration = " ".join(scene_info['shot_texts'])
-        preview = scene_narration[:60] + "..." if len(scene_narration) > 60 else scene_narration
         selectable_items.append((
             f"Scene {scene_info['number']}: {scene_info['title']}",
             "scene",
@@ -1294,18 +1548,17 @@ def render_audio_tab(config: ProjectConfig) -> None:
                 shot_text
             ))
 
-    selected_item = st.selectbox(
+    # Select by position so shots with the same label stay distinct
+    item_labels = [item[0] for item in selectable_items]
+    selected_index = st.selectbox(
         "Select scene or shot",
-        options=[item[0] for item in selectable_items],
+        options=range(len(selectable_items)),
+        format_func=item_labels.__getitem__,
         help="Choose a specific scene or shot to generate audio for",
     )
 
     if st.button("Generate Selected Audio", width='stretch'):
-        selected_index = next(
-            (idx for idx, item in enumerate(selectable_items) if item[0] == selected_item),
-            0,
-        )
-        item = selectable_items[selected_index]
+        item = selectable_items[selected_index or 0]
         generate_selected_audio(config, item, tts_model, tts_voice, tts_speed)
 
 
@@ -1344,20 +1597,36 @@ def _build_script_preview(
     return "\n\n".join(parts)
 
 
+def _reset_script_preview(
+    config: ProjectConfig,
+    shot_pause_seconds: float,
+    section_pause_seconds: float,
+) -> None:
+    """Rebuild the audio script preview from the parsed scenes.
+
+    Runs as a button callback, before the preview widget is created, so
+    its keyed state may still be overwritten.
+    """
+    text = _build_script_preview(config, shot_pause_seconds, section_pause_seconds)
+    st.session_state.audio_script_preview_text = text
+    st.session_state.audio_script_preview = text
+
+
+@st.cache_data(max_entries=4, show_spinner=False)
 def _parse_preview_text(preview_text: str) -> list[dict]:
     """Parse preview text into structured scene/shot data.
 
+    Cached on the text, since the audio tab's selector re-parses the
+    preview on every rerun.
+
     Args:
         preview_text: Script preview text with scene markers and pause indicators
 
     Returns:
         List of dicts with scene_num, scene_title, and shot_texts
     """
-    import re
-
     # Split by scene markers
-    scene_pattern = r"=== SCENE (\d+): (.+?) ===\n"
-    scene_splits = re.split(scene_pattern, preview_text)
+    scene_splits = SCENE_HEADER_RE.split(preview_text)
 
     # First element is empty or content before first scene
     scene_data = []
@@ -1369,10 +1638,10 @@ def _parse_preview_text(preview_text: str) -> list[dict]:
 
             # Remove pause markers and split into shots
             # Remove scene pause markers first (handles variable durations)
-            scene_content = re.sub(r'\n\[PAUSE [\d.]+s\]\n', '', scene_content)
+            scene_content = SCENE_PAUSE_RE.sub('', scene_content)
 
             # Split by shot pause markers (handles variable durations)
-            shot_texts = re.split(r'\n\n\[PAUSE [\d.]+s\]\n\n', scene_content)
+            shot_texts = SHOT_PAUSE_RE.split(scene_content)
 
             scene_data.append({
                 'number': scene_num,
@@ -1399,13 +1668,14 @@ def _update_scenes_from_preview(config: ProjectConfig, preview_text: str) -> boo
         # Update scenes in config
         for scene_info in scene_data:
             # Find matching scene in config
-            scene = next((s for s in config.scenes if s.number == scene_info['number']), None)
+            scene = config.get_scene(scene_info['number'])
             if scene and scene_info['shot_texts']:
                 # Update shot narrations
                 for i, shot in enumerate(scene.shots):
                     if i < len(scene_info['shot_texts']):
                         shot.narration = scene_info['shot_texts'][i]
 
+        _bump_config_rev()
         return True
 
     except Exception as e:
@@ -1432,6 +1702,20 @@ def _ms_to_timecode(milliseconds: int, fps: int = 30) -> str:
     return f"{hours:02d}:{minutes:02d}:{seconds:02d}:{frames:02d}"
 
 
+def _save_shot_durations(durations: List[Tuple[int, int, float]]) -> None:
+    """Write measured shot durations to the project in a single save.
+
+    Failures are reported in one warning rather than one per shot.
+    """
+    try:
+        st.session_state.project_manager.update_shot_durations(
+            project_name=st.session_state.current_project,
+            durations=durations,
+        )
+    except Exception as e:
+        st.warning(f"⚠️ Could not update shot durations: {str(e)}")
+
+
 def generate_full_audio(
     config: ProjectConfig,
     model: str,
@@ -1475,9 +1759,8 @@ def generate_full_audio(
         from io import BytesIO
 
         from pydub import AudioSegment
+        from pydub.utils import get_encoder_name
 
-        combined_audio = AudioSegment.empty()
-        total_scenes = len(scene_data)
         progress = st.progress(0.0)
 
         # Track timestamps for each scene and shot
@@ -1496,94 +1779,159 @@ def generate_full_audio(
             "scenes": []
         }
 
-        status.update(label="Generating audio segments...", state="running")
-
-        current_time_ms = 0
+        shot_jobs = [
+            (scene_idx, shot_idx, shot_text)
+            for scene_idx, scene_info in enumerate(scene_data)
+            for shot_idx, shot_text in enumerate(scene_info['shot_texts'])
+            if shot_text and shot_text.strip()
+        ]
+        status.update(
+            label=f"Generating {len(shot_jobs)} audio segments "
+            f"(up to {TTS_BATCH_WORKERS} at a time)...",
+            state="running",
+        )
 
-        for scene_idx, scene_info in enumerate(scene_data):
-            scene_start_ms = current_time_ms
-            scene_shots = []
+        # TTS requests are independent network calls; fetch them on a pool,
+        # then assemble the narration below in script order
+        audio_by_shot = {}
+        executor = ThreadPoolExecutor(
+            max_workers=max(1, min(TTS_BATCH_WORKERS, len(shot_jobs)))
+        )
+        try:
+            futures = {
+                executor.submit(
+                    generator.generate_audio_bytes,
+                    text=shot_text,
+                    model=model,
+                    voice=voice,
+                    speed=speed,
+                ): (scene_idx, shot_idx)
+                for scene_idx, shot_idx, shot_text in shot_jobs
+            }
+            for future in as_completed(futures):
+                audio_by_shot[futures[future]] = future.result()
+                progress.progress(len(audio_by_shot) / len(shot_jobs))
+        finally:
+            # Don't start queued shots after a failure; in-flight ones finish
+            executor.shutdown(wait=False, cancel_futures=True)
 
-            for shot_idx, shot_text in enumerate(scene_info['shot_texts']):
-                shot_start_ms = current_time_ms
+        status.update(label="Assembling audio...", state="running")
 
-                if shot_text and shot_text.strip():
-                    # Generate audio for this shot
-                    audio_bytes = generator.generate_audio_bytes(
-                        text=shot_text,
-                        model=model,
-                        voice=voice,
-                        speed=speed,
-                    )
+        current_time_ms = 0
 
-                    # Load as AudioSegment
-                    audio_segment = AudioSegment.from_mp3(BytesIO(audio_bytes))
-                    shot_duration_ms = len(audio_segment)
-                    shot_duration_seconds = shot_duration_ms / 1000.0
-                    combined_audio += audio_segment
-                    current_time_ms += shot_duration_ms
-
-                    # Update project config with actual audio duration
-                    try:
-                        pm = st.session_state.project_manager
-                        pm.update_shot_duration(
-                            project_name=st.session_state.current_project,
-                            scene_number=scene_info['number'],
-                            shot_number=shot_idx + 1,
-                            actual_duration=shot_duration_seconds,
-                        )
-                    except Exception as e:
-                        # Log warning but continue processing
-                        st.warning(f"⚠️ Could not update duration for Scene {scene_info['number']}, Shot {shot_idx + 1}: {str(e)}")
-
-                    # Record shot timing
-                    scene_shots.append({
-                        "shot_number": shot_idx + 1,
-                        "start_ms": shot_start_ms,
-                        "end_ms": current_time_ms,
-                        "duration_ms": shot_duration_ms,
-                        "start_timecode": _ms_to_timecode(shot_start_ms, fps),
-                        "end_timecode": _ms_to_timecode(current_time_ms, fps),
-                        "narration_preview": shot_text[:100] + "..." if len(shot_text) > 100 else shot_text
+        # Only two pause lengths occur; build each silence buffer once
+        shot_pause_ms = int(shot_pause_seconds * 1000)
+        section_pause_ms = int(section_pause_seconds * 1000)
+        shot_silence = AudioSegment.silent(
+            duration=shot_pause_ms, frame_rate=NARRATION_FRAME_RATE
+        ).raw_data
+        section_silence = AudioSegment.silent(
+            duration=section_pause_ms, frame_rate=NARRATION_FRAME_RATE
+        ).raw_data
+
+        # Written to the project in one save once all shots are measured
+        shot_durations = []
+
+        # Decoded shots are streamed to a WAV file and encoded once at the
+        # end, so only one shot's PCM is held in memory at a time
+        pcm_path = audio_dir / "full_narration.wav.tmp"
+        # The temporary WAV is removed however assembly or encoding ends
+        try:
+            narration_pcm = wave.open(str(pcm_path), "wb")
+            narration_pcm.setnchannels(NARRATION_CHANNELS)
+            narration_pcm.setsampwidth(NARRATION_SAMPLE_WIDTH)
+            narration_pcm.setframerate(NARRATION_FRAME_RATE)
+            try:
+                for scene_idx, scene_info in enumerate(scene_data):
+                    scene_start_ms = current_time_ms
+                    scene_shots = []
+
+                    for shot_idx, shot_text in enumerate(scene_info['shot_texts']):
+                        shot_start_ms = current_time_ms
+
+                        if shot_text and shot_text.strip():
+                            audio_bytes = audio_by_shot[(scene_idx, shot_idx)]
+
+                            # Load as AudioSegment
+                            audio_segment = (
+                                AudioSegment.from_mp3(BytesIO(audio_bytes))
+                                .set_frame_rate(NARRATION_FRAME_RATE)
+                                .set_channels(NARRATION_CHANNELS)
+                                .set_sample_width(NARRATION_SAMPLE_WIDTH)
+                            )
+                            shot_duration_ms = len(audio_segment)
+                            shot_duration_seconds = shot_duration_ms / 1000.0
+                            narration_pcm.writeframes(audio_segment.raw_data)
+                            current_time_ms += shot_duration_ms
+
+                            shot_durations.append((
+                                scene_info['number'],
+                                shot_idx + 1,
+                                shot_duration_seconds,
+                            ))
+
+                            # Record shot timing
+                            scene_shots.append({
+                                "shot_number": shot_idx + 1,
+                                "start_ms": shot_start_ms,
+                                "end_ms": current_time_ms,
+                                "duration_ms": shot_duration_ms,
+                                "start_timecode": _ms_to_timecode(shot_start_ms, fps),
+                                "end_timecode": _ms_to_timecode(current_time_ms, fps),
+                                "narration_preview": (
+                                    shot_text[:100] + "..."
+                                    if len(shot_text) > 100
+                                    else shot_text
+                                ),
+                            })
+
+                            # Add pause between shots (except last shot in scene)
+                            if shot_idx < len(scene_info['shot_texts']) - 1:
+                                narration_pcm.writeframes(shot_silence)
+                                current_time_ms += shot_pause_ms
+
+                    scene_end_ms = current_time_ms
+
+                    # Record scene timing
+                    timeline_data["scenes"].append({
+                        "scene_number": scene_info['number'],
+                        "scene_title": scene_info['title'],
+                        "start_ms": scene_start_ms,
+                        "end_ms": scene_end_ms,
+                        "duration_ms": scene_end_ms - scene_start_ms,
+                        "start_timecode": _ms_to_timecode(scene_start_ms, fps),
+                        "end_timecode": _ms_to_timecode(scene_end_ms, fps),
+                        "shots": scene_shots
                     })
 
-                    # Add pause between shots (except last shot in scene)
-                    if shot_idx < len(scene_info['shot_texts']) - 1:
-                        pause_ms = int(shot_pause_seconds * 1000)
-                        combined_audio += AudioSegment.silent(duration=pause_ms)
-                        current_time_ms += pause_ms
-
-            scene_end_ms = current_time_ms
-
-            # Record scene timing
-            timeline_data["scenes"].append({
-                "scene_number": scene_info['number'],
-                "scene_title": scene_info['title'],
-                "start_ms": scene_start_ms,
-                "end_ms": scene_end_ms,
-                "duration_ms": scene_end_ms - scene_start_ms,
-                "start_timecode": _ms_to_timecode(scene_start_ms, fps),
-                "end_timecode": _ms_to_timecode(scene_end_ms, fps),
-                "shots": scene_shots
-            })
-
-            # Add pause between scenes (except last scene)
-            if scene_idx < len(scene_data) - 1:
-                pause_ms = int(section_pause_seconds * 1000)
-                combined_audio += AudioSegment.silent(duration=pause_ms)
-                current_time_ms += pause_ms
+                    # Add pause between scenes (except last scene)
+                    if scene_idx < len(scene_data) - 1:
+                        narration_pcm.writeframes(section_silence)
+                        current_time_ms += section_pause_ms
+            finally:
+                narration_pcm.close()
+
+            # Save combined audio
+            output_path = audio_dir / "full_narration.mp3"
+            status.update(label="Saving audio file...", state="running")
+            subprocess.run(
+                [
+                    get_encoder_name(), "-y", "-loglevel", "error",
+                    "-i", str(pcm_path), "-f", "mp3", str(output_path),
+                ],
+                check=True,
+                capture_output=True,
+            )
+        finally:
+            pcm_path.unlink(missing_ok=True)
 
-            progress.progress((scene_idx + 1) / total_scenes)
+        # Only record durations once the narration they describe is saved
+        _save_shot_durations(shot_durations)
 
         # Update total duration
         timeline_data["total_duration_ms"] = current_time_ms
         timeline_data["total_duration_timecode"] = _ms_to_timecode(current_time_ms, fps)
 
-        # Save combined audio
-        output_path = audio_dir / "full_narration.mp3"
-        status.update(label="Saving audio file...", state="running")
-        combined_audio.export(output_path, format="mp3")
-
         # Save timeline data as JSON
         timeline_path = audio_dir / "timeline_timestamps.json"
         status.update(label="Saving timeline data...", state="running")
@@ -1650,41 +1998,69 @@ def generate_audio_by_scene(
 
         total_scenes = len(scene_data)
         progress = st.progress(0.0)
+        scene_durations = []
+        failures = []
 
-        for scene_idx, scene_info in enumerate(scene_data):
-            status.update(
-                label=f"Generating Scene {scene_info['number']}: {scene_info['title']}",
-                state="running",
-            )
-
-            # Combine all shot narrations for this scene
-            scene_narration = " ".join(scene_info['shot_texts'])
+        # Combine all shot narrations for each scene
+        jobs = [
+            (scene_info['number'], " ".join(scene_info['shot_texts']))
+            for scene_info in scene_data
+        ]
+        jobs = [(number, narration) for number, narration in jobs if narration.strip()]
+        status.update(
+            label=f"Generating {len(jobs)} scenes "
+            f"(up to {TTS_BATCH_WORKERS} at a time)...",
+            state="running",
+        )
 
-            if scene_narration.strip():
-                audio_path, actual_duration = generator.generate_scene_audio(
+        # Scene files are independent; synthesize them on a pool and record
+        # results from this thread as each one finishes
+        executor = ThreadPoolExecutor(
+            max_workers=max(1, min(TTS_BATCH_WORKERS, len(jobs)))
+        )
+        try:
+            futures = {
+                executor.submit(
+                    generator.generate_scene_audio,
                     project_dir=project_dir,
-                    scene_number=scene_info['number'],
-                    narration=scene_narration,
+                    scene_number=scene_number,
+                    narration=narration,
                     model=model,
                     voice=voice,
                     speed=speed,
-                )
-
-                # Update project config with actual audio duration
+                ): scene_number
+                for scene_number, narration in jobs
+            }
+            for completed, future in enumerate(as_completed(futures), start=1):
+                scene_number = futures[future]
                 try:
-                    pm = st.session_state.project_manager
-                    pm.update_scene_duration(
-                        project_name=st.session_state.current_project,
-                        scene_number=scene_info['number'],
-                        actual_duration=actual_duration,
-                    )
+                    _, actual_duration = future.result()
+                    scene_durations.append((scene_number, actual_duration))
                 except Exception as e:
-                    st.warning(f"⚠️ Could not update duration for Scene {scene_info['number']}: {str(e)}")
+                    failures.append(f"Scene {scene_number}: {e}")
+                progress.progress(completed / len(jobs))
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
 
-            progress.progress((scene_idx + 1) / total_scenes)
+        if failures:
+            st.warning(
+                f"⚠️ {len(failures)} scene(s) failed:\n\n" + "\n\n".join(failures)
+            )
+
+        # Update project config with actual audio durations in one save
+        try:
+            st.session_state.project_manager.update_scene_durations(
+                project_name=st.session_state.current_project,
+                durations=scene_durations,
+            )
+        except Exception as e:
+            st.warning(f"⚠️ Could not update scene durations: {str(e)}")
 
         status.update(label="Scene audio generation complete", state="complete")
-        st.success(f"✅ Generated {total_scenes} scene audio files in {project_dir / 'audio'}")
+        st.success(
+            f"✅ Generated {len(scene_durations)} of {total_scenes} scene audio files "
+            f"in {project_dir / 'audio'}"
+        )
 
     except Exception as e:
         status.update(label="Audio generation failed", state="error")
@@ -1718,43 +2094,72 @@ def generate_audio_by_shot(
         # Count total shots
         total_shots = sum(len(scene_info['shot_texts']) for scene_info in scene_data)
         progress = st.progress(0.0)
-        completed = 0
+        shot_durations = []
+        failures = []
+
+        jobs = [
+            (scene_info['number'], shot_idx, shot_text)
+            for scene_info in scene_data
+            for shot_idx, shot_text in enumerate(scene_info['shot_texts'], start=1)
+            if shot_text and shot_text.strip()
+        ]
+        status.update(
+            label=f"Generating {len(jobs)} shots "
+            f"(up to {TTS_BATCH_WORKERS} at a time)...",
+            state="running",
+        )
 
-        for scene_info in scene_data:
-            for shot_idx, shot_text in enumerate(scene_info['shot_texts'], start=1):
-                if shot_text and shot_text.strip():
+        # Shot files are independent; synthesize them on a pool and record
+        # results from this thread as each one finishes
+        executor = ThreadPoolExecutor(
+            max_workers=max(1, min(TTS_BATCH_WORKERS, len(jobs)))
+        )
+        try:
+            futures = {
+                executor.submit(
+                    generator.generate_shot_audio,
+                    project_dir=project_dir,
+                    scene_number=scene_number,
+                    shot_number=shot_number,
+                    narration=shot_text,
+                    model=model,
+                    voice=voice,
+                    speed=speed,
+                ): (scene_number, shot_number)
+                for scene_number, shot_number, shot_text in jobs
+            }
+            last_label_at = 0.0
+            for completed, future in enumerate(as_completed(futures), start=1):
+                scene_number, shot_number = futures[future]
+                try:
+                    _, actual_duration = future.result()
+                    shot_durations.append((scene_number, shot_number, actual_duration))
+                except Exception as e:
+                    failures.append(f"Scene {scene_number}, Shot {shot_number}: {e}")
+                now = time.monotonic()
+                if now - last_label_at >= STATUS_UPDATE_INTERVAL:
+                    last_label_at = now
                     status.update(
-                        label=f"Generating Scene {scene_info['number']}, Shot {shot_idx}",
+                        label=f"Generated Scene {scene_number}, Shot {shot_number} "
+                        f"({completed}/{len(jobs)})",
                         state="running",
                     )
+                progress.progress(completed / len(jobs))
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
 
-                    audio_path, actual_duration = generator.generate_shot_audio(
-                        project_dir=project_dir,
-                        scene_number=scene_info['number'],
-                        shot_number=shot_idx,
-                        narration=shot_text,
-                        model=model,
-                        voice=voice,
-                        speed=speed,
-                    )
+        if failures:
+            st.warning(
+                f"⚠️ {len(failures)} shot(s) failed:\n\n" + "\n\n".join(failures)
+            )
 
-                    # Update project config with actual audio duration
-                    try:
-                        pm = st.session_state.project_manager
-                        pm.update_shot_duration(
-                            project_name=st.session_state.current_project,
-                            scene_number=scene_info['number'],
-                            shot_number=shot_idx,
-                            actual_duration=actual_duration,
-                        )
-                    except Exception as e:
-                        st.warning(f"⚠️ Could not update duration for Scene {scene_info['number']}, Shot {shot_idx}: {str(e)}")
-
-                completed += 1
-                progress.progress(completed / total_shots)
+        _save_shot_durations(shot_durations)
 
         status.update(label="Shot audio generation complete", state="complete")
-        st.success(f"✅ Generated {total_shots} shot audio files in {project_dir / 'audio'}")
+        st.success(
+            f"✅ Generated {len(shot_durations)} of {total_shots} shot audio files "
+            f"in {project_dir / 'audio'}"
+        )
 
     except Exception as e:
         status.update(label="Audio generation failed", state="error")
@@ -2070,10 +2475,8 @@ def render_export_tab(config: ProjectConfig) -> None:
 
         for scene_data in timeline_data.get('scenes', []):
             scene_num = scene_data['scene_number']
-            scene_title = next(
-                (s.title for s in config.scenes if s.number == scene_num),
-                f"Scene {scene_num}"
-            )
+            scene = config.get_scene(scene_num)
+            scene_title = scene.title if scene else f"Scene {scene_num}"
 
             scene_start = scene_data['start_ms'] / 1000
             scene_duration = scene_data['duration_ms'] / 1000
@@ -2708,80 +3111,99 @@ def generate_all_videos(
             return
 
         from kurzgesagt.core import VideoGenerator
+        from kurzgesagt.core.video_generator import stage_limits
 
         generator = VideoGenerator(api_key=settings.gemini_api_key)
         project_dir = get_project_path(
             settings.projects_dir, st.session_state.current_project
         )
 
+        # Per-project stage limits (submit/poll/save) over the defaults
+        limits = stage_limits(config.technical.video_concurrency)
         total = len(available_shots)
         progress = st.progress(0.0)
 
         generated_videos = []
         failed_videos = []
 
-        for idx, item in enumerate(available_shots):
+        # Style context is shared by every shot
+        style_context = config.style.aesthetic.description
+
+        shot_jobs = []
+        for item in available_shots:
             scene = item['scene']
             shot = item['shot']
-            image_path = item['image_path']
+            shot_jobs.append({
+                "project_dir": project_dir,
+                "scene_number": scene.number,
+                "shot_number": shot.number,
+                "image_path": item['image_path'],
+                "video_prompt": shot.video_prompt,
+                "key_elements": shot.key_elements,
+                "style_context": style_context,
+                # Get shot duration (capped at 8 seconds for API limit)
+                "duration": min(int(shot.duration), 8),
+            })
+
+        status.update(
+            label=f"Generating {total} videos (up to {limits['poll']} at a time)...",
+            state="running"
+        )
 
-            # Get shot duration (capped at 8 seconds for API limit)
-            shot_duration = min(int(shot.duration), 8)
+        completed = 0
 
-            status.update(
-                label=f"Generating Scene {scene.number} Shot {shot.number} - {shot_duration}s video ({idx+1}/{total})...",
-                state="running"
+        def on_shot_done(index: int, result: Union[Path, str, Exception]) -> None:
+            # Runs on the script thread as each Veo job finishes
+            nonlocal completed
+            completed += 1
+            scene = available_shots[index]['scene']
+            shot = available_shots[index]['shot']
+            outcome = "failed" if isinstance(result, Exception) else "done"
+            status.write(
+                f"Scene {scene.number}, Shot {shot.number} {outcome} "
+                f"({completed}/{total})"
+            )
+            progress.progress(completed / total)
+
+        # Veo jobs run concurrently; results come back in input order
+        results = asyncio.run(
+            generator.save_shots_batch(
+                shot_jobs,
+                concurrency=limits,
+                on_result=on_shot_done
             )
+        )
 
-            try:
-                # Get style context
-                style_context = config.style.aesthetic.description
+        for item, result in zip(available_shots, results):
+            scene = item['scene']
+            shot = item['shot']
 
-                # Generate video
-                result = generator.save_shot_video(
-                    project_dir=project_dir,
-                    scene_number=scene.number,
-                    shot_number=shot.number,
-                    image_path=image_path,
-                    video_prompt=shot.video_prompt,
-                    key_elements=shot.key_elements,
-                    style_context=style_context,
-                    duration=shot_duration
+            if isinstance(result, Path):
+                # Success - video was downloaded and saved locally
+                generated_videos.append(result)
+                logger.info(f"Generated video: {result}")
+            elif isinstance(result, Exception):
+                logger.error(
+                    f"Failed Scene {scene.number} Shot {shot.number}: {result}"
                 )
-
-                if isinstance(result, Path):
-                    # Success - video was downloaded and saved locally
-                    generated_videos.append(result)
-                    logger.info(f"Generated video: {result}")
-                else:
-                    # Manual download required - result is a URI
-                    logger.warning(f"Video generated but requires manual download: {result}")
-                    failed_videos.append({
-                        'scene': scene.number,
-                        'shot': shot.number,
-                        'uri': result,
-                        'message': 'Manual download required - automatic download failed'
-                    })
-
-            except VideoGenerationError as e:
-                logger.error(f"Failed Scene {scene.number} Shot {shot.number}: {e}")
                 failed_videos.append({
                     'scene': scene.number,
                     'shot': shot.number,
                     'uri': None,
-                    'message': str(e)
+                    'message': str(result)
                 })
-            except Exception as e:
-                logger.error(f"Failed Scene {scene.number} Shot {shot.number}: {e}")
+            else:
+                # Manual download required - result is a URI
+                logger.warning(
+                    f"Video generated but requires manual download: {result}"
+                )
                 failed_videos.append({
                     'scene': scene.number,
                     'shot': shot.number,
-                    'uri': None,
-                    'message': str(e)
+                    'uri': result,
+                    'message': 'Manual download required - automatic download failed'
                 })
 
-            progress.progress((idx + 1) / total)
-
         status.update(label="Video generation complete", state="complete")
 
         # Show results
@@ -2840,6 +3262,8 @@ def generate_selected_video(
     selected_item: dict
 ) -> None:
     """Generate video for a specific shot."""
+    from kurzgesagt.core import VideoGenerationError, VideoGenerator
+
     status = st.status("Generating video...", expanded=False)
 
     try:
@@ -2849,8 +3273,6 @@ def generate_selected_video(
             st.error("❌ GEMINI_API_KEY not configured in .env file")
             return
 
-        from kurzgesagt.core import VideoGenerator
-
         generator = VideoGenerator(api_key=settings.gemini_api_key)
         project_dir = get_project_path(
             settings.projects_dir, st.session_state.current_project
@@ -2933,24 +3355,24 @@ def render_settings_tab(config: ProjectConfig) -> None:
     with col1:
         config.technical.aspect_ratio = st.selectbox(
             "Aspect Ratio",
-            options=list(AspectRatio),
+            options=enum_options(AspectRatio),
             format_func=lambda x: x.value,
-            index=list(AspectRatio).index(config.technical.aspect_ratio),
+            index=enum_index(config.technical.aspect_ratio),
         )
 
         config.technical.model = st.selectbox(
             "Target Model",
-            options=list(ModelType),
-            format_func=lambda x: x.value.replace("_", " ").title(),
-            index=list(ModelType).index(config.technical.model),
+            options=enum_options(ModelType),
+            format_func=enum_format(ModelType),
+            index=enum_index(config.technical.model),
         )
 
     with col2:
         config.technical.shot_complexity = st.selectbox(
             "Shot Complexity",
-            options=list(ShotComplexity),
-            format_func=lambda x: x.value.title(),
-            index=list(ShotComplexity).index(config.technical.shot_complexity),
+            options=enum_options(ShotComplexity),
+            format_func=enum_format(ShotComplexity, str.title),
+            index=enum_index(config.technical.shot_complexity),
         )
 
         config.technical.text_on_screen = st.checkbox(
@@ -2974,16 +3396,16 @@ def render_settings_tab(config: ProjectConfig) -> None:
 
     config.technical.image_aspect_ratio = st.selectbox(
         "Image Aspect Ratio",
-        options=list(ImageAspectRatio),
+        options=enum_options(ImageAspectRatio),
         format_func=lambda x: x.value,
-        index=list(ImageAspectRatio).index(config.technical.image_aspect_ratio),
+        index=enum_index(config.technical.image_aspect_ratio),
     )
 
     config.technical.image_resolution = st.selectbox(
         "Image Resolution",
-        options=list(ImageResolution),
+        options=enum_options(ImageResolution),
         format_func=lambda x: x.value,
-        index=list(ImageResolution).index(config.technical.image_resolution),
+        index=enum_index(config.technical.image_resolution),
     )
 
 
@@ -0,0 +1,45 @@
+"""Selectbox choices for enum-backed settings.
+
+Streamlit re-executes ``app.py`` on every rerun, so per-enum options and
+index maps live in this imported module, where they are built once per
+process.
+"""
+
+from enum import Enum
+from functools import lru_cache
+from typing import Callable, Dict, Tuple, Type
+
+
+@lru_cache(maxsize=None)
+def enum_options(enum_cls: Type[Enum]) -> Tuple[Enum, ...]:
+    """Selectbox options for an enum, in definition order."""
+    return tuple(enum_cls)
+
+
+@lru_cache(maxsize=None)
+def _enum_positions(enum_cls: Type[Enum]) -> Dict[Enum, int]:
+    """Map each member of an enum to its selectbox index."""
+    return {member: i for i, member in enumerate(enum_options(enum_cls))}
+
+
+def enum_index(member: Enum) -> int:
+    """Selectbox index of ``member`` without scanning the enum."""
+    return _enum_positions(type(member))[member]
+
+
+def humanize(value: str) -> str:
+    """Turn an id such as ``cinematic_doc`` into ``Cinematic Doc``."""
+    return value.replace("_", " ").title()
+
+
+@lru_cache(maxsize=None)
+def enum_format(
+    enum_cls: Type[Enum], transform: Callable[[str], str] = humanize
+) -> Callable[[Enum], str]:
+    """Selectbox ``format_func`` serving precomputed labels for an enum.
+
+    ``transform`` must be a module-level function (or builtin such as
+    ``str.capitalize``) so the cache key is stable across reruns.
+    """
+    labels = {member: transform(member.value) for member in enum_cls}
+    return labels.__getitem__
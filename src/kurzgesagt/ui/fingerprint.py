@@ -0,0 +1,18 @@
+"""Change-detection fingerprints for the voice-over script.
+
+The script tab compares the current voice-over against the one last
+parsed on every rerun. Hashing is memoized here rather than in ``app.py``,
+which Streamlit re-executes from scratch on each rerun.
+"""
+
+import zlib
+from functools import lru_cache
+
+
+@lru_cache(maxsize=4)
+def script_fingerprint(text: str) -> str:
+    """Length-prefixed CRC32 of ``text``; not for security use.
+
+    The length prefix means scripts of different lengths never collide.
+    """
+    return f"{len(text)}:{zlib.crc32(text.encode()):08x}"
@@ -6,6 +6,7 @@ from .file_handlers import (
     get_project_path,
     list_project_directories,
     safe_write_text,
+    write_bytes_unbuffered,
 )
 from .logging import configure_logging, get_logger
 from .validators import (
@@ -32,6 +33,7 @@ __all__ = [
     # File handlers
     "ensure_directory",
     "safe_write_text",
+    "write_bytes_unbuffered",
     "list_project_directories",
     "get_project_path",
     "delete_project",
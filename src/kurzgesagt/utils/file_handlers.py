@@ -1,5 +1,6 @@
 """File handling utilities."""
 
+import os
 import shutil
 from pathlib import Path
 from typing import List
@@ -42,6 +43,28 @@ def safe_write_text(path: Path, content: str, backup: bool = True) -> None:
     path.write_text(content, encoding="utf-8")
 
 
+def write_bytes_unbuffered(path: Path, data: bytes) -> None:
+    """
+    Write binary data straight to a file descriptor, bypassing Python buffering.
+
+    Large payloads (e.g. generated videos) usually go out in a single
+    ``write(2)``; short writes are retried until everything is written.
+
+    Args:
+        path: File path
+        data: Bytes to write (file is created or truncated)
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(path, flags, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+
+
 def list_project_directories(base_path: Path) -> List[str]:
     """
     List all project directories.
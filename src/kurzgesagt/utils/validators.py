@@ -98,10 +98,11 @@ def validate_voice_over_script(script: str, min_length: int = 10) -> None:
     Raises:
         ValidationError: If script is invalid
     """
-    if not script or not script.strip():
+    stripped = script.strip() if script else ""
+    if not stripped:
         raise ValidationError("Voice-over script cannot be empty")
 
-    if len(script.strip()) < min_length:
+    if len(stripped) < min_length:
         raise ValidationError(
             f"Voice-over script must be at least {min_length} characters"
         )
@@ -1,5 +1,6 @@
 """Tests for audio generation."""
 
+import os
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -362,3 +363,71 @@ class TestGenerateShotAudio:
 
         assert "scene_03" in str(result)
         assert "shot_07" in str(result)
+
+
+class TestAudioCache:
+    """Test reuse of synthesized clips across runs."""
+
+    def test_identical_inputs_reuse_cached_clip(self, mock_openai_client, tmp_path):
+        """Test unchanged text and settings skip the API call."""
+        mock_response = MagicMock()
+        mock_response.read.return_value = b"cached_audio"
+        mock_openai_client.audio.speech.create.return_value = mock_response
+
+        generator = AudioGenerator(
+            api_key="test_key", cache_dir=tmp_path / ".tts_cache"
+        )
+
+        first = generator.generate_audio_bytes("Hello world")
+        second = generator.generate_audio_bytes("Hello world  ")
+
+        assert first == second == b"cached_audio"
+        assert mock_openai_client.audio.speech.create.call_count == 1
+        assert len(list((tmp_path / ".tts_cache").glob("*.mp3"))) == 1
+
+    def test_changed_inputs_regenerate(self, mock_openai_client, tmp_path):
+        """Test a different voice or speed misses the cache."""
+        mock_response = MagicMock()
+        mock_response.read.return_value = b"audio"
+        mock_openai_client.audio.speech.create.return_value = mock_response
+
+        generator = AudioGenerator(api_key="test_key", cache_dir=tmp_path)
+
+        generator.generate_audio_bytes("Hello")
+        generator.generate_audio_bytes("Hello", voice="nova")
+        generator.generate_audio_bytes("Hello", speed=1.25)
+
+        assert mock_openai_client.audio.speech.create.call_count == 3
+
+    def test_no_cache_dir_always_calls_api(self, mock_openai_client):
+        """Test caching is off by default."""
+        mock_response = MagicMock()
+        mock_response.read.return_value = b"audio"
+        mock_openai_client.audio.speech.create.return_value = mock_response
+
+        generator = AudioGenerator(api_key="test_key")
+
+        generator.generate_audio_bytes("Hello")
+        generator.generate_audio_bytes("Hello")
+
+        assert mock_openai_client.audio.speech.create.call_count == 2
+
+    def test_evicts_least_recently_used_clips(self, mock_openai_client, tmp_path):
+        """Test the oldest clips are removed once the cache is over its limit."""
+        mock_response = MagicMock()
+        mock_response.read.return_value = b"x" * 10
+        mock_openai_client.audio.speech.create.return_value = mock_response
+
+        generator = AudioGenerator(api_key="test_key", cache_dir=tmp_path)
+
+        with patch("src.kurzgesagt.core.audio_generator.TTS_CACHE_MAX_BYTES", 25):
+            for index, text in enumerate(["one", "two", "three"]):
+                generator.generate_audio_bytes(text)
+                # Give each clip a distinct, increasing use time
+                newest = generator._cache_key(text, "tts-1", "alloy", 1.0)
+                os.utime(tmp_path / f"{newest}.mp3", (index, index))
+
+        remaining = {path.name for path in tmp_path.glob("*.mp3")}
+        oldest = generator._cache_key("one", "tts-1", "alloy", 1.0)
+        assert f"{oldest}.mp3" not in remaining
+        assert len(remaining) == 2
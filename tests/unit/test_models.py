@@ -1,14 +1,24 @@
 """Unit tests for data models."""
 
+import subprocess
+import sys
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
 import pytest
+import yaml
 from pydantic import ValidationError
 
 from src.kurzgesagt.models import (
+    Aesthetic,
     ProjectConfig,
     ProjectMetadata,
     Scene,
     Shot,
+    StyleGuide,
 )
+from src.kurzgesagt.models.scene import parse_shots_json
 
 
 def test_shot_creation():
@@ -27,6 +37,21 @@ def test_shot_creation():
     assert not shot.is_nested
 
 
+def test_shot_is_nested_maps_to_flags(sample_scene):
+    """Test the legacy is_nested bool reads and writes the nested flag bit."""
+    data = sample_scene.shots[0].model_dump()
+    shot = Shot(**{**data, "is_nested": True})
+
+    assert shot.is_nested
+    assert shot.flags == Shot.FLAG_NESTED
+    assert "is_nested" not in shot.model_dump()
+
+    shot.is_nested = False
+    assert shot.flags == 0
+    with pytest.raises(ValidationError):
+        Shot(**{**data, "is_nested": "maybe"})
+
+
 def test_shot_validation():
     """Test shot validation rules."""
     with pytest.raises(ValidationError):
@@ -69,6 +94,80 @@ def test_project_yaml_roundtrip(temp_dir, sample_project_config):
     assert loaded.metadata.title == sample_project_config.metadata.title
 
 
+def test_project_yaml_readable_by_pure_python_loader(temp_dir, sample_project_config):
+    """Test files written with the C dumper stay plain safe YAML."""
+    yaml_path = temp_dir / "test_config.yaml"
+    sample_project_config.to_yaml(yaml_path)
+
+    with open(yaml_path, encoding="utf-8") as f:
+        data = yaml.load(f, Loader=yaml.SafeLoader)
+
+    assert data == sample_project_config.to_dict()
+
+
+def test_project_trusted_load_matches_validated_load(
+    temp_dir, sample_project_config, sample_scene
+):
+    """Test checksummed files rebuild the same typed models without validation."""
+    yaml_path = temp_dir / "test_config.yaml"
+    sample_project_config.scenes = [sample_scene]
+    sample_project_config.style.aesthetic = Aesthetic.CINEMATIC_DOC
+    sample_project_config.to_yaml(yaml_path)
+
+    with patch.object(ProjectConfig, "from_yaml") as validated:
+        loaded = ProjectConfig.from_yaml_trusted(yaml_path)
+
+    validated.assert_not_called()
+    assert loaded.to_dict() == ProjectConfig.from_yaml(yaml_path).to_dict()
+    assert isinstance(loaded.scenes[0].shots[0], Shot)
+    assert isinstance(loaded.scenes[0].shots[0].key_elements, tuple)
+    assert loaded.style.aesthetic is Aesthetic.CINEMATIC_DOC
+    assert isinstance(loaded.metadata.created_at, datetime)
+
+
+def test_project_trusted_load_validates_edited_files(
+    temp_dir, sample_project_config, sample_scene
+):
+    """Test a stale or missing checksum falls back to full validation."""
+    yaml_path = temp_dir / "test_config.yaml"
+    sample_project_config.scenes = [sample_scene]
+    sample_project_config.to_yaml(yaml_path)
+
+    edited = yaml_path.read_text(encoding="utf-8").replace(
+        sample_scene.title, sample_scene.title.lower()
+    )
+    yaml_path.write_text(edited, encoding="utf-8")
+    loaded = ProjectConfig.from_yaml_trusted(yaml_path)
+    assert loaded.scenes[0].title == sample_scene.title
+
+    yaml_path.with_suffix(".sha256").unlink()
+    assert ProjectConfig.from_yaml_trusted(yaml_path).scenes[0].title == (
+        sample_scene.title
+    )
+
+
+def test_project_trusted_load_validates_older_schema_files(
+    temp_dir, sample_project_config, sample_scene
+):
+    """Test files saved under an older schema are re-validated on load."""
+    yaml_path = temp_dir / "test_config.yaml"
+    # Data an older release saved before key elements were stripped
+    shot = sample_scene.shots[0].model_copy(update={"key_elements": (" orbit ",)})
+    sample_project_config.scenes = [
+        sample_scene.model_copy(update={"shots": [shot]})
+    ]
+
+    with patch("src.kurzgesagt.models.project._schema_tag", return_value="0.old"):
+        sample_project_config.to_yaml(yaml_path)
+    loaded = ProjectConfig.from_yaml_trusted(yaml_path)
+    assert loaded.scenes[0].shots[0].key_elements == ("orbit",)
+
+    # The same bytes under the current schema are trusted as written
+    sample_project_config.to_yaml(yaml_path)
+    loaded = ProjectConfig.from_yaml_trusted(yaml_path)
+    assert loaded.scenes[0].shots[0].key_elements == (" orbit ",)
+
+
 def test_scene_shot_count():
     """Test scene shot_count property."""
     shot1 = Shot(
@@ -124,6 +223,81 @@ def test_scene_add_shot():
     assert scene.shots[0] == shot
 
 
+def test_shot_key_elements_are_cleaned():
+    """Test key elements are stripped and blank entries dropped."""
+    shot = Shot(
+        number=1,
+        narration="Test",
+        duration=5.0,
+        description="Test",
+        image_prompt="Image",
+        video_prompt="Video",
+        key_elements=["  planet ", "", "   ", "moon"],
+    )
+
+    assert shot.key_elements == ("planet", "moon")
+
+
+def test_parse_shots_json():
+    """Test a JSON shot array validates straight into Shot models."""
+    raw = (
+        b'[{"number": 1, "narration": "N", "duration": 4, "description": "D",'
+        b' "image_prompt": "I", "video_prompt": "V", "key_elements": [" a ", ""]}]'
+    )
+
+    shots = parse_shots_json(raw)
+
+    assert isinstance(shots[0], Shot)
+    assert shots[0].key_elements == ("a",)
+    with pytest.raises(ValidationError):
+        parse_shots_json(b'[{"number": 0}]')
+
+
+def test_shot_from_json(sample_scene):
+    """Test a single shot validates straight from JSON."""
+    shot = sample_scene.shots[0]
+
+    assert Shot.from_json(shot.model_dump_json()) == shot
+    with pytest.raises(ValidationError):
+        Shot.from_json('{"number": 1}')
+
+
+def test_build_trusted_skips_validation(sample_scene):
+    """Test trusted builders keep data as given and still apply defaults."""
+    shot = Shot.build_trusted(**sample_scene.shots[0].model_dump())
+    scene = Scene.build_trusted(
+        number=1, title="lower", purpose="P", duration=5, shots=[shot]
+    )
+
+    assert scene.title == "lower"
+    assert scene.shots[0] is shot
+    assert scene.transition_duration == 1.0
+    assert scene.calculate_duration() == shot.duration
+
+
+def test_model_schemas_built_at_import():
+    """Test no model defers its validator build to first use."""
+    for model in (Shot, Scene, ProjectConfig, StyleGuide, ProjectMetadata):
+        assert model.__pydantic_complete__, model.__name__
+
+
+def test_shot_transition_notes_are_interned(sample_scene):
+    """Test identical transition notes share one string object."""
+    data = sample_scene.shots[0].model_dump()
+    first = Shot(**{**data, "transition_note": "".join(["cross", "fade"])})
+    second = Shot(**{**data, "transition_note": "".join(["cross", "fade"])})
+
+    assert first.transition_note is second.transition_note
+
+
+def test_shot_transition_note_defaults_to_empty(sample_scene):
+    """Test a missing or null transition note is stored as an empty string."""
+    data = sample_scene.shots[0].model_dump()
+
+    assert Shot(**{**data, "transition_note": None}).transition_note == ""
+    assert sample_scene.shots[0].transition_note == ""
+
+
 def test_scene_calculate_duration():
     """Test scene calculate_duration method."""
     shot1 = Shot(
@@ -159,6 +333,94 @@ def test_scene_calculate_duration():
     assert calculated == 11.5
 
 
+def test_scene_calculate_duration_tracks_shot_edits(sample_scene):
+    """Test the cached duration follows reset edits and additions."""
+    assert sample_scene.calculate_duration() == 5
+
+    sample_scene.shots[0].duration = 7
+    assert sample_scene.calculate_duration() == 5
+    sample_scene.reset_timing()
+    assert sample_scene.calculate_duration() == 7
+
+    sample_scene.add_shot(sample_scene.shots[0].model_copy(update={"number": 2}))
+    assert sample_scene.calculate_duration() == 14.5
+
+    sample_scene.shots = []
+    assert sample_scene.calculate_duration() == 0.0
+
+
+def test_scene_timeline_offsets(sample_scene):
+    """Test shot start offsets include preceding transitions."""
+    second = sample_scene.shots[0].model_copy(update={"number": 2, "duration": 3})
+    sample_scene.add_shot(second)
+
+    assert sample_scene.timeline_offsets() == (0.0, 5.5)
+    assert sample_scene.calculate_duration() == 8.5
+
+    second.duration = 4
+    sample_scene.reset_timing()
+    assert sample_scene.calculate_duration() == 9.5
+
+
+def test_scene_timing_cache_is_per_scene(sample_scene):
+    """Test editing one scene keeps other scenes' cached timing."""
+    other = sample_scene.model_copy(
+        update={"number": 2, "shots": [sample_scene.shots[0].model_copy()]}
+    )
+    sample_scene.calculate_duration()
+    other.calculate_duration()
+    cached = other._timing_cache
+
+    sample_scene.shots[0].duration = 7
+    sample_scene.reset_timing()
+    sample_scene.add_shot(sample_scene.shots[0].model_copy(update={"number": 2}))
+
+    assert sample_scene.calculate_duration() == 14.5
+    assert other._timing_cache is cached
+
+
+def test_scene_get_shot_tracks_list_changes(sample_scene):
+    """Test shot lookup by number follows appends, renumbering and reassignment."""
+    first = sample_scene.shots[0]
+    assert sample_scene.get_shot(1) is first
+    assert sample_scene.get_shot(2) is None
+
+    second = first.model_copy(update={"number": 2})
+    sample_scene.add_shot(second)
+    assert sample_scene.get_shot(2) is second
+
+    first.number = 3
+    assert sample_scene.get_shot(1) is None
+    assert sample_scene.get_shot(3) is first
+
+    sample_scene.shots = [second]
+    assert sample_scene.get_shot(3) is None
+
+
+def test_project_config_get_scene(sample_project_config, sample_scene):
+    """Test scene lookup by number is reset when scenes are reassigned."""
+    assert sample_project_config.get_scene(1) is None
+
+    sample_project_config.scenes = [sample_scene]
+    assert sample_project_config.get_scene(1) is sample_scene
+
+    # Same length, different list
+    replacement = sample_scene.model_copy()
+    sample_project_config.scenes = [replacement]
+    assert sample_project_config.get_scene(1) is replacement
+
+    sample_project_config.scenes = []
+    assert sample_project_config.get_scene(1) is None
+
+
+def test_scene_total_duration(sample_scene):
+    """Test totals sum each scene's shot-based duration."""
+    empty = Scene(number=2, title="EMPTY", purpose="P", duration=1)
+
+    assert Scene.total_duration([sample_scene, empty, sample_scene]) == 10
+    assert Scene.total_duration([]) == 0
+
+
 def test_scene_calculate_duration_empty_shots():
     """Test scene calculate_duration with no shots."""
     scene = Scene(
@@ -231,3 +493,46 @@ def test_project_config_shot_count():
 
     assert config.shot_count == 2
 
+
+
+def test_aesthetic_descriptions_forbid_text():
+    """Test every aesthetic preset is normalized to forbid rendered text."""
+    for aesthetic in Aesthetic:
+        assert aesthetic.description == aesthetic.description.rstrip()
+        assert "no text" in aesthetic.description.lower()
+
+    assert Aesthetic.CINEMATIC_DOC.description.endswith(
+        "No text or lettering in the image."
+    )
+
+
+def test_style_guide_coerces_aesthetic_strings():
+    """Test aesthetic ids are normalized and unknown values fall back."""
+    assert StyleGuide(aesthetic="Cinematic Doc").aesthetic is Aesthetic.CINEMATIC_DOC
+    assert StyleGuide(aesthetic="isometric_tech").aesthetic is Aesthetic.ISOMETRIC_TECH
+    assert StyleGuide(aesthetic="unknown").aesthetic is Aesthetic.KURZGESAGT
+    assert StyleGuide(aesthetic=42).aesthetic is Aesthetic.KURZGESAGT
+
+
+def test_models_package_exports_lazily():
+    """Test star-imports still work and unused submodules stay unloaded."""
+    import src.kurzgesagt.models as models
+
+    namespace: dict = {}
+    exec("from src.kurzgesagt.models import *", namespace)
+    assert set(models.__all__) <= namespace.keys()
+    # Names once missing from divergent copies of the package __init__
+    assert {"Aesthetic", "ImageAspectRatio", "ImageResolution"} <= set(
+        models.__all__
+    )
+
+    with pytest.raises(AttributeError):
+        models.NotAModel
+
+    code = (
+        "import sys\n"
+        "from src.kurzgesagt.models import Shot\n"
+        "assert 'src.kurzgesagt.models.project' not in sys.modules\n"
+    )
+    repo_root = Path(__file__).resolve().parents[2]
+    subprocess.run([sys.executable, "-c", code], cwd=repo_root, check=True)
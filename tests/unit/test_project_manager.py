@@ -1,5 +1,9 @@
 """Unit tests for ProjectManager."""
 
+import subprocess
+import sys
+from pathlib import Path
+
 import pytest
 
 from src.kurzgesagt.core import ProjectNotFoundError
@@ -204,6 +208,72 @@ def test_update_scene_duration_nonexistent_scene(project_manager, sample_project
         )
 
 
+def test_update_shot_durations(project_manager, sample_project_config):
+    """Test updating several shot durations in one call."""
+    shots = [
+        Shot(
+            number=number,
+            narration=f"Shot {number}",
+            duration=5.0,
+            description=f"Shot {number}",
+            image_prompt="Image",
+            video_prompt="Video",
+            key_elements=[],
+        )
+        for number in (1, 2)
+    ]
+    scene = Scene(
+        number=1,
+        title="TEST SCENE",
+        purpose="Test purpose",
+        duration=10.5,
+        shots=shots,
+    )
+    sample_project_config.scenes = [scene]
+    project_manager.save(sample_project_config, "test-project")
+
+    project_manager.update_shot_durations(
+        project_name="test-project",
+        durations=[(1, 1, 7.5), (1, 2, 4.0)],
+    )
+
+    loaded = project_manager.load("test-project")
+    assert [shot.duration for shot in loaded.scenes[0].shots] == [7.5, 4.0]
+    # 7.5 + 0.5 (transition) + 4.0
+    assert loaded.scenes[0].duration == 12.0
+
+
+def test_update_shot_durations_reports_missing(project_manager, sample_project_config):
+    """Test missing shots are reported after the others are saved."""
+    shot = Shot(
+        number=1,
+        narration="Test narration",
+        duration=5.0,
+        description="Test shot",
+        image_prompt="Image",
+        video_prompt="Video",
+        key_elements=[],
+    )
+    scene = Scene(
+        number=1,
+        title="TEST SCENE",
+        purpose="Test purpose",
+        duration=5.0,
+        shots=[shot],
+    )
+    sample_project_config.scenes = [scene]
+    project_manager.save(sample_project_config, "test-project")
+
+    with pytest.raises(ValueError, match="Scene 1, Shot 999"):
+        project_manager.update_shot_durations(
+            project_name="test-project",
+            durations=[(1, 1, 8.0), (1, 999, 5.0)],
+        )
+
+    loaded = project_manager.load("test-project")
+    assert loaded.scenes[0].shots[0].duration == 8.0
+
+
 def test_update_transition_durations(project_manager, sample_project_config):
     """Test updating all transition durations in project."""
     shot1 = Shot(
@@ -275,3 +345,21 @@ def test_update_transition_durations_nonexistent_project(project_manager):
             scene_transition=1.0,
         )
 
+
+
+def test_core_package_defers_sdk_imports():
+    """Test importing ProjectManager leaves the provider SDKs unloaded."""
+    import src.kurzgesagt.core as core
+
+    namespace: dict = {}
+    exec("from src.kurzgesagt.core import *", namespace)
+    assert set(core.__all__) <= namespace.keys()
+
+    code = (
+        "import sys\n"
+        "from src.kurzgesagt.core import ProjectManager\n"
+        "for name in ('anthropic', 'openai', 'google.genai'):\n"
+        "    assert name not in sys.modules, name\n"
+    )
+    repo_root = Path(__file__).resolve().parents[2]
+    subprocess.run([sys.executable, "-c", code], cwd=repo_root, check=True)
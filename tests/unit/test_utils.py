@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 import logging
+import os
 from pathlib import Path
 
 import pytest
 
+from src.kurzgesagt.utils.file_handlers import write_bytes_unbuffered
 from src.kurzgesagt.utils.logging import configure_logging, get_logger
 from src.kurzgesagt.utils.validators import (
     ValidationError,
@@ -110,3 +112,24 @@ def test_validate_file_path(tmp_path: Path) -> None:
 def test_estimate_reading_time() -> None:
     text = "word " * 150
     assert estimate_reading_time(text, words_per_minute=150) == 60
+
+
+def test_write_bytes_unbuffered_truncates(tmp_path: Path) -> None:
+    target = tmp_path / "video.mp4"
+    target.write_bytes(b"x" * 100)
+
+    write_bytes_unbuffered(target, b"\x00\x01mp4")
+
+    assert target.read_bytes() == b"\x00\x01mp4"
+
+
+def test_write_bytes_unbuffered_retries_short_writes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    real_write = os.write
+    monkeypatch.setattr(os, "write", lambda fd, data: real_write(fd, data[:3]))
+    target = tmp_path / "video.mp4"
+
+    write_bytes_unbuffered(target, b"0123456789")
+
+    assert target.read_bytes() == b"0123456789"
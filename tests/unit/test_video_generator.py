@@ -1,10 +1,23 @@
 """Tests for video generation from images."""
 
-from unittest.mock import MagicMock, patch
+import asyncio
+import threading
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from src.kurzgesagt.core.video_generator import VideoGenerationError, VideoGenerator
+from src.kurzgesagt.core.video_generator import (
+    CONCURRENCY,
+    HTTP_POOL_SIZE,
+    HTTP_TIMEOUT_MS,
+    PromptBuilder,
+    VideoGenerationError,
+    VideoGenerator,
+    _prompt_builder_for,
+    stage_limits,
+)
 
 
 @pytest.fixture
@@ -32,6 +45,16 @@ class TestVideoGeneratorInit:
         generator = VideoGenerator(api_key="test_key")
         assert generator.client is not None
 
+    def test_init_sizes_http_pool(self):
+        """Test the client gets an explicit timeout and connection pool."""
+        with patch("src.kurzgesagt.core.video_generator.genai") as mock_genai:
+            VideoGenerator(api_key="test_key")
+
+        http_options = mock_genai.Client.call_args.kwargs["http_options"]
+        assert http_options.timeout == HTTP_TIMEOUT_MS
+        for client_args in (http_options.client_args, http_options.async_client_args):
+            assert client_args["limits"].max_connections == HTTP_POOL_SIZE
+
     def test_init_without_api_key(self):
         """Test initialization fails without API key."""
         with pytest.raises(VideoGenerationError) as exc_info:
@@ -99,6 +122,78 @@ class TestBuildVideoPrompt:
         assert "parallax effects" in result
         assert "consistent pacing" in result
 
+    def test_build_video_prompt_layout(self, mock_genai_client):
+        """Test the exact prompt layout sent to Veo."""
+        generator = VideoGenerator(api_key="test_key")
+
+        result = generator._build_video_prompt(
+            base_prompt="Base",
+            key_elements="a, b",
+            style_context="Style",
+            duration=6
+        )
+
+        assert result == (
+            "Base\n"
+            "\nAnimate these key elements: a, b\n"
+            "\nStyle and animation details:\n"
+            "Style\n"
+            "\nCamera movement: Smooth cinematic motion with subtle zoom and "
+            "parallax effects.\n"
+            "Maintain visual consistency with the starting image while adding "
+            "dynamic movement.\n"
+            "Duration: 6 seconds with consistent pacing throughout."
+        )
+
+
+class TestPromptBuilder:
+    """Test the shared per-project prompt builder."""
+
+    def test_build_matches_generator_prompt(self, mock_genai_client):
+        """Test the builder produces the same prompt as the generator."""
+        generator = VideoGenerator(api_key="test_key")
+        builder = PromptBuilder("x" * 1000)
+
+        assert builder.build("Base", ["a", "b"], 8) == generator._build_video_prompt(
+            "Base", "a, b", "x" * 1000, 8
+        )
+
+    def test_build_without_key_elements(self):
+        """Test an empty element list animates all elements."""
+        prompt = PromptBuilder("Style").build("Base", [], 8)
+
+        assert "Animate these key elements: all elements" in prompt
+
+    def test_builder_shared_per_style(self):
+        """Test calls without a builder reuse one per style context."""
+        first = _prompt_builder_for("Shared style")
+
+        assert _prompt_builder_for("Shared style") is first
+        assert _prompt_builder_for("Other style") is not first
+
+    def test_save_shot_video_uses_given_builder(
+        self, mock_genai_client, temp_image, tmp_path
+    ):
+        """Test a caller-supplied builder is used for the prompt."""
+        mock_genai_client.models.generate_videos.return_value = _completed_operation()
+        generator = VideoGenerator(api_key="test_key")
+        builder = MagicMock(wraps=PromptBuilder("Shared style"))
+
+        generator.save_shot_video(
+            project_dir=tmp_path,
+            scene_number=1,
+            shot_number=1,
+            image_path=temp_image,
+            video_prompt="Test",
+            key_elements=["a"],
+            style_context="Shared style",
+            prompt_builder=builder,
+        )
+
+        builder.build.assert_called_once_with("Test", ["a"], 8)
+        prompt = mock_genai_client.models.generate_videos.call_args.kwargs["prompt"]
+        assert "Shared style" in prompt
+
 
 class TestGenerateVideoFromImage:
     """Test video generation from image."""
@@ -135,3 +230,600 @@ class TestGenerateVideoFromImage:
 
         assert "Failed to start video generation" in str(exc_info.value)
 
+    def test_generate_video_submits_image_contents(self, mock_genai_client, temp_image):
+        """Test the image contents reach the SDK unchanged."""
+        submitted = {}
+
+        def _capture(**kwargs):
+            submitted["image_bytes"] = bytes(kwargs["image"].image_bytes)
+            return _completed_operation()
+
+        mock_genai_client.models.generate_videos.side_effect = _capture
+
+        generator = VideoGenerator(api_key="test_key")
+        result = generator.generate_video_from_image(
+            image_path=temp_image,
+            video_prompt="Test",
+            key_elements=[],
+            style_context="Style"
+        )
+
+        assert submitted["image_bytes"] == b"fake_png_data"
+        assert result.video_bytes == b"fake_mp4_data"
+
+    def test_read_image_missing_file(self, mock_genai_client, tmp_path):
+        """Test an unreadable image raises VideoGenerationError."""
+        generator = VideoGenerator(api_key="test_key")
+
+        with pytest.raises(VideoGenerationError, match="Failed to read image"):
+            generator._read_image(tmp_path / "missing.png")
+
+
+class TestPolling:
+    """Test polling of long-running video operations."""
+
+    def test_poll_async_waits_until_done(self, mock_genai_client):
+        """Test the async poll path refreshes until the operation completes."""
+        pending = MagicMock()
+        pending.done = False
+        mock_genai_client.aio.operations.get = AsyncMock(
+            return_value=_completed_operation()
+        )
+        generator = VideoGenerator(api_key="test_key")
+
+        with patch(
+            "src.kurzgesagt.core.video_generator.asyncio.sleep", new=AsyncMock()
+        ) as mock_sleep:
+            operation = asyncio.run(generator._poll_async(pending))
+
+        assert operation.done is True
+        mock_genai_client.aio.operations.get.assert_awaited_once_with(pending)
+        mock_genai_client.operations.get.assert_not_called()
+        mock_sleep.assert_awaited_once()
+
+    def test_poll_async_wraps_status_errors(self, mock_genai_client):
+        """Test async status failures surface as VideoGenerationError."""
+        pending = MagicMock()
+        pending.done = False
+        mock_genai_client.aio.operations.get = AsyncMock(
+            side_effect=RuntimeError("boom")
+        )
+        generator = VideoGenerator(api_key="test_key")
+
+        sleep = patch(
+            "src.kurzgesagt.core.video_generator.asyncio.sleep", new=AsyncMock()
+        )
+        with sleep, pytest.raises(
+            VideoGenerationError, match="Failed to poll operation status"
+        ):
+            asyncio.run(generator._poll_async(pending))
+
+    def test_poll_sleeps_with_jitter(self, mock_genai_client):
+        """Test the sync poll path waits at least the base interval."""
+        pending = MagicMock()
+        pending.done = False
+        mock_genai_client.operations.get.return_value = _completed_operation()
+        generator = VideoGenerator(api_key="test_key")
+
+        with patch("src.kurzgesagt.core.video_generator.time.sleep") as mock_sleep:
+            operation = generator._poll(pending)
+
+        assert operation.done is True
+        (delay,), _ = mock_sleep.call_args
+        assert 10 <= delay <= 12
+
+    def _poll_delays(self, mock_genai_client, operations):
+        """Run the sync poll loop over ``operations`` and return each sleep."""
+        pending = MagicMock()
+        pending.done = False
+        mock_genai_client.operations.get.side_effect = operations
+        generator = VideoGenerator(api_key="test_key")
+
+        with (
+            patch("src.kurzgesagt.core.video_generator.random.uniform", return_value=0),
+            patch("src.kurzgesagt.core.video_generator.time.sleep") as mock_sleep,
+        ):
+            generator._poll(pending)
+
+        return [call.args[0] for call in mock_sleep.call_args_list]
+
+    def test_poll_backs_off_while_idle(self, mock_genai_client):
+        """Test delays grow geometrically up to the cap without progress."""
+        idle = MagicMock(done=False, metadata=None)
+
+        delays = self._poll_delays(
+            mock_genai_client, [idle] * 5 + [_completed_operation()]
+        )
+
+        assert delays == [10, 15, 22.5, 30, 30, 30]
+
+    def test_poll_resets_delay_on_progress(self, mock_genai_client):
+        """Test reported forward progress restores the base interval."""
+        def at(percent):
+            return MagicMock(done=False, metadata={"progressPercent": percent})
+
+        delays = self._poll_delays(
+            mock_genai_client,
+            [at(10), at(10), at(10), at(40), _completed_operation()],
+        )
+
+        assert delays == [10, 10, 15, 22.5, 10]
+
+    def test_poll_times_out(self, mock_genai_client):
+        """Test polling gives up once the poll budget is spent."""
+        pending = MagicMock()
+        pending.done = False
+        mock_genai_client.operations.get.return_value = pending
+        generator = VideoGenerator(api_key="test_key")
+
+        with patch("src.kurzgesagt.core.video_generator.time.sleep"):
+            with pytest.raises(
+                VideoGenerationError, match="timed out after 10 minutes"
+            ):
+                generator._poll(pending)
+
+
+class TestVideoCache:
+    """Test reuse of previously generated clips."""
+
+    def _save(self, generator, tmp_path, temp_image, **overrides):
+        kwargs = {
+            "project_dir": tmp_path,
+            "scene_number": 1,
+            "shot_number": 1,
+            "image_path": temp_image,
+            "video_prompt": "Test",
+            "key_elements": [],
+            "style_context": "Style",
+        }
+        kwargs.update(overrides)
+        return generator.save_shot_video(**kwargs)
+
+    def test_identical_inputs_reuse_cached_clip(
+        self, mock_genai_client, temp_image, tmp_path
+    ):
+        """Test a rerun with unchanged inputs skips generation."""
+        mock_genai_client.models.generate_videos.return_value = _completed_operation()
+        generator = VideoGenerator(api_key="test_key")
+
+        self._save(generator, tmp_path, temp_image)
+        path = self._save(generator, tmp_path, temp_image, shot_number=2)
+
+        assert mock_genai_client.models.generate_videos.call_count == 1
+        assert path.read_bytes() == b"fake_mp4_data"
+        assert len(list((tmp_path / ".veo_cache").glob("*.mp4"))) == 1
+
+    def test_uncached_submission_reads_image_once(
+        self, mock_genai_client, temp_image, tmp_path
+    ):
+        """Test the image bytes read for hashing are reused for submission."""
+        mock_genai_client.models.generate_videos.return_value = _completed_operation()
+        generator = VideoGenerator(api_key="test_key")
+
+        with patch.object(
+            generator, "_read_image", wraps=generator._read_image
+        ) as read_image:
+            self._save(generator, tmp_path, temp_image)
+
+        assert read_image.call_count == 1
+        submitted = mock_genai_client.models.generate_videos.call_args.kwargs["image"]
+        assert submitted.image_bytes == b"fake_png_data"
+
+    def test_changed_inputs_regenerate(self, mock_genai_client, temp_image, tmp_path):
+        """Test a different prompt or image misses the cache."""
+        mock_genai_client.models.generate_videos.return_value = _completed_operation()
+        generator = VideoGenerator(api_key="test_key")
+
+        self._save(generator, tmp_path, temp_image)
+        self._save(generator, tmp_path, temp_image, video_prompt="Changed")
+        temp_image.write_bytes(b"other_png_data")
+        self._save(generator, tmp_path, temp_image)
+
+        assert mock_genai_client.models.generate_videos.call_count == 3
+
+    def test_force_refresh_bypasses_cache(
+        self, mock_genai_client, temp_image, tmp_path
+    ):
+        """Test force_refresh regenerates and refreshes the cached clip."""
+        mock_genai_client.models.generate_videos.side_effect = [
+            _completed_operation(b"first"),
+            _completed_operation(b"second"),
+        ]
+        generator = VideoGenerator(api_key="test_key")
+
+        self._save(generator, tmp_path, temp_image)
+        path = self._save(generator, tmp_path, temp_image, force_refresh=True)
+
+        assert mock_genai_client.models.generate_videos.call_count == 2
+        assert path.read_bytes() == b"second"
+        (cached,) = (tmp_path / ".veo_cache").glob("*.mp4")
+        assert cached.read_bytes() == b"second"
+
+
+class TestWebhookGeneration:
+    """Test webhook-driven generation without polling."""
+
+    def test_save_shot_video_webhook_registers_callback(
+        self, mock_genai_client, temp_image
+    ):
+        """Test the callback URL and shot ids are sent with the job."""
+        pending = MagicMock()
+        pending.name = "operations/abc"
+        mock_genai_client.models.generate_videos.return_value = pending
+        generator = VideoGenerator(api_key="test_key")
+
+        name = generator.save_shot_video_webhook(
+            scene_number=2,
+            shot_number=3,
+            image_path=temp_image,
+            video_prompt="Test",
+            key_elements=[],
+            style_context="Style",
+            callback_url="https://example.com/hook",
+        )
+
+        assert name == "operations/abc"
+        config = mock_genai_client.models.generate_videos.call_args.kwargs["config"]
+        assert config.webhook_config.uris == ["https://example.com/hook"]
+        assert config.webhook_config.user_metadata == {
+            "scene_number": 2,
+            "shot_number": 3,
+        }
+        mock_genai_client.operations.get.assert_not_called()
+
+    def test_polling_submission_omits_webhook_config(
+        self, mock_genai_client, temp_image, tmp_path
+    ):
+        """Test polled jobs never send the webhook field."""
+        mock_genai_client.models.generate_videos.return_value = _completed_operation()
+        generator = VideoGenerator(api_key="test_key")
+
+        generator.save_shot_video(
+            project_dir=tmp_path,
+            scene_number=1,
+            shot_number=1,
+            image_path=temp_image,
+            video_prompt="Test",
+            key_elements=[],
+            style_context="Style",
+        )
+
+        config = mock_genai_client.models.generate_videos.call_args.kwargs["config"]
+        assert "webhook_config" not in config.model_fields_set
+
+    def test_save_pending_shot_video(self, mock_genai_client, tmp_path):
+        """Test a finished operation is fetched once and saved."""
+        mock_genai_client.operations.get.return_value = _completed_operation()
+        generator = VideoGenerator(api_key="test_key")
+
+        path = generator.save_pending_shot_video(tmp_path, 1, 2, "operations/abc")
+
+        assert path == tmp_path / "videos" / "scene_01" / "shot_02.mp4"
+        assert path.read_bytes() == b"fake_mp4_data"
+        (operation,), _ = mock_genai_client.operations.get.call_args
+        assert operation.name == "operations/abc"
+
+    def test_resolve_pending_still_running(self, mock_genai_client):
+        """Test resolving an unfinished operation raises."""
+        running = MagicMock()
+        running.done = False
+        mock_genai_client.operations.get.return_value = running
+        generator = VideoGenerator(api_key="test_key")
+
+        with pytest.raises(VideoGenerationError, match="still running"):
+            generator.resolve_pending("operations/abc")
+
+
+def _completed_operation(video_bytes=b"fake_mp4_data"):
+    """Build a finished operation carrying inline video bytes."""
+    operation = MagicMock()
+    operation.done = True
+    operation.response.generated_videos = [MagicMock()]
+    operation.response.generated_videos[0].video.video_bytes = video_bytes
+    return operation
+
+
+class TestSaveShotsBatch:
+    """Test concurrent batch video generation."""
+
+    def test_save_shots_batch_saves_each_shot(
+        self, mock_genai_client, temp_image, tmp_path
+    ):
+        """Test every shot in the batch is generated and saved in order."""
+        mock_genai_client.models.generate_videos.return_value = _completed_operation()
+        generator = VideoGenerator(api_key="test_key")
+
+        shots = [
+            {
+                "project_dir": tmp_path,
+                "scene_number": 1,
+                "shot_number": number,
+                "image_path": temp_image,
+                "video_prompt": "Test",
+                "key_elements": [],
+                "style_context": "Style",
+            }
+            for number in (1, 2, 3)
+        ]
+
+        results = asyncio.run(generator.save_shots_batch(shots, max_concurrency=2))
+
+        assert results == [
+            tmp_path / "videos" / "scene_01" / f"shot_{number:02d}.mp4"
+            for number in (1, 2, 3)
+        ]
+        assert all(path.read_bytes() == b"fake_mp4_data" for path in results)
+
+    def test_save_shots_batch_returns_exceptions(
+        self, mock_genai_client, temp_image, tmp_path
+    ):
+        """Test a failing shot does not cancel the rest of the batch."""
+        mock_genai_client.models.generate_videos.return_value = _completed_operation()
+        generator = VideoGenerator(api_key="test_key")
+
+        base = {
+            "project_dir": tmp_path,
+            "scene_number": 1,
+            "video_prompt": "Test",
+            "key_elements": [],
+            "style_context": "Style",
+        }
+        shots = [
+            {**base, "shot_number": 1, "image_path": tmp_path / "missing.png"},
+            {**base, "shot_number": 2, "image_path": temp_image},
+        ]
+
+        results = asyncio.run(generator.save_shots_batch(shots))
+
+        assert isinstance(results[0], VideoGenerationError)
+        assert results[1].exists()
+
+    def test_save_shots_batch_limits_in_flight_requests(
+        self, mock_genai_client, temp_image, tmp_path
+    ):
+        """Test no more than max_concurrency generate_videos calls overlap."""
+        lock = threading.Lock()
+        in_flight = 0
+        peak = 0
+
+        def slow_generate(**kwargs):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.05)
+            with lock:
+                in_flight -= 1
+            return _completed_operation()
+
+        mock_genai_client.models.generate_videos.side_effect = slow_generate
+        generator = VideoGenerator(api_key="test_key")
+
+        shots = [
+            {
+                "project_dir": tmp_path,
+                "scene_number": 1,
+                "shot_number": number,
+                "image_path": temp_image,
+                "video_prompt": f"Test {number}",
+                "key_elements": [],
+                "style_context": "Style",
+            }
+            for number in range(1, 7)
+        ]
+
+        asyncio.run(generator.save_shots_batch(shots, max_concurrency=2))
+
+        assert mock_genai_client.models.generate_videos.call_count == 6
+        assert peak == 2
+
+    def test_save_shots_batch_holds_slot_until_polled(
+        self, mock_genai_client, temp_image, tmp_path
+    ):
+        """Test a submitted job keeps its slot until polling finishes."""
+        in_flight = 0
+        peak = 0
+
+        def generate(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            return _completed_operation()
+
+        async def slow_poll(operation):
+            nonlocal in_flight
+            await asyncio.sleep(0.05)
+            in_flight -= 1
+            return operation
+
+        mock_genai_client.models.generate_videos.side_effect = generate
+        generator = VideoGenerator(api_key="test_key")
+
+        shots = [
+            {
+                "project_dir": tmp_path,
+                "scene_number": 1,
+                "shot_number": number,
+                "image_path": temp_image,
+                "video_prompt": f"Test {number}",
+                "key_elements": [],
+                "style_context": "Style",
+            }
+            for number in range(1, 5)
+        ]
+
+        with patch.object(generator, "_poll_async", side_effect=slow_poll):
+            asyncio.run(generator.save_shots_batch(shots, max_concurrency=2))
+
+        assert peak == 2
+
+    def test_save_shots_batch_reads_images_inside_slot(
+        self, mock_genai_client, temp_image, tmp_path
+    ):
+        """Test images are only read once a shot holds an in-flight slot."""
+        reads = 0
+        reads_at_poll = []
+        mock_genai_client.models.generate_videos.return_value = _completed_operation()
+        generator = VideoGenerator(api_key="test_key")
+        read_image = generator._read_image
+
+        def counting_read(image_path):
+            nonlocal reads
+            reads += 1
+            return read_image(image_path)
+
+        async def slow_poll(operation):
+            reads_at_poll.append(reads)
+            await asyncio.sleep(0.01)
+            return operation
+
+        shots = [
+            {
+                "project_dir": tmp_path,
+                "scene_number": 1,
+                "shot_number": number,
+                "image_path": temp_image,
+                "video_prompt": f"Test {number}",
+                "key_elements": [],
+                "style_context": "Style",
+            }
+            for number in range(1, 5)
+        ]
+
+        with (
+            patch.object(generator, "_read_image", side_effect=counting_read),
+            patch.object(generator, "_poll_async", side_effect=slow_poll),
+        ):
+            asyncio.run(generator.save_shots_batch(shots, max_concurrency=1))
+
+        assert reads_at_poll == [1, 2, 3, 4]
+
+    def test_save_shots_batch_saves_outside_generation_slot(
+        self, mock_genai_client, temp_image, tmp_path
+    ):
+        """Test the next shot is submitted while the previous one is saved."""
+        second_submitted = threading.Event()
+        submitted = 0
+
+        def generate(**kwargs):
+            nonlocal submitted
+            submitted += 1
+            if submitted == 2:
+                second_submitted.set()
+            return _completed_operation()
+
+        mock_genai_client.models.generate_videos.side_effect = generate
+        generator = VideoGenerator(api_key="test_key")
+        store = generator._store_result
+
+        def slow_store(result, project_dir, scene_number, shot_number):
+            if shot_number == 1:
+                assert second_submitted.wait(timeout=5)
+            return store(result, project_dir, scene_number, shot_number)
+
+        shots = [
+            {
+                "project_dir": tmp_path,
+                "scene_number": 1,
+                "shot_number": number,
+                "image_path": temp_image,
+                "video_prompt": f"Test {number}",
+                "key_elements": [],
+                "style_context": "Style",
+            }
+            for number in (1, 2)
+        ]
+
+        with patch.object(generator, "_store_result", side_effect=slow_store):
+            results = asyncio.run(generator.save_shots_batch(shots, max_concurrency=1))
+
+        assert all(isinstance(result, Path) for result in results)
+
+    def test_save_shots_batch_reports_each_result(
+        self, mock_genai_client, temp_image, tmp_path
+    ):
+        """Test on_result fires once per shot, including bad shot kwargs."""
+        mock_genai_client.models.generate_videos.return_value = _completed_operation()
+        generator = VideoGenerator(api_key="test_key")
+
+        shots = [
+            {
+                "project_dir": tmp_path,
+                "scene_number": 1,
+                "shot_number": 1,
+                "image_path": temp_image,
+                "video_prompt": "Test",
+                "key_elements": [],
+                "style_context": "Style",
+            },
+            {"unexpected": True},
+        ]
+        reported = {}
+
+        results = asyncio.run(
+            generator.save_shots_batch(
+                shots, on_result=lambda index, result: reported.update({index: result})
+            )
+        )
+
+        assert isinstance(results[1], TypeError)
+        assert reported == {0: results[0], 1: results[1]}
+
+    def test_save_shots_batch_limits_submissions_per_stage(
+        self, mock_genai_client, temp_image, tmp_path
+    ):
+        """Test the submit stage limit applies independently of jobs in flight."""
+        lock = threading.Lock()
+        in_flight = 0
+        peak = 0
+
+        def slow_generate(**kwargs):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.05)
+            with lock:
+                in_flight -= 1
+            return _completed_operation()
+
+        mock_genai_client.models.generate_videos.side_effect = slow_generate
+        generator = VideoGenerator(api_key="test_key")
+
+        shots = [
+            {
+                "project_dir": tmp_path,
+                "scene_number": 1,
+                "shot_number": number,
+                "image_path": temp_image,
+                "video_prompt": f"Test {number}",
+                "key_elements": [],
+                "style_context": "Style",
+            }
+            for number in range(1, 5)
+        ]
+
+        asyncio.run(
+            generator.save_shots_batch(
+                shots, concurrency={"submit": 1, "poll": 4}
+            )
+        )
+
+        assert peak == 1
+
+    def test_save_shots_batch_rejects_invalid_concurrency(self, mock_genai_client):
+        """Test max_concurrency must be positive."""
+        generator = VideoGenerator(api_key="test_key")
+
+        with pytest.raises(ValueError):
+            asyncio.run(generator.save_shots_batch([], max_concurrency=0))
+        with pytest.raises(ValueError):
+            asyncio.run(generator.save_shots_batch([], concurrency={"upload": 2}))
+
+
+def test_stage_limits_merges_overrides():
+    """Test per-project overrides replace only the given stages."""
+    limits = stage_limits({"poll": 16})
+
+    assert limits == {**CONCURRENCY, "poll": 16}
+    assert stage_limits() == CONCURRENCY